@@ -5,8 +5,14 @@ This orchestrator uses actual MCP protocol calls to coordinate
 AI-driven specification and implementation services.
 """
 
+import ast
 import asyncio
+import copy
 import json
+import mmap
+import os
+import re
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 
@@ -15,6 +21,174 @@ from mcp_servers.docker_mcp_server import DockerMCPServer
 from mcp_servers.implementation_server import ImplementationMCPServer
 from mcp_servers.monitoring_server import MonitoringMCPServer
 
+# Prefer orjson's C decoder for tool results when it is installed
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+# Runs of characters that are not allowed in a domain name
+_DOMAIN_SANITIZE_RE = re.compile(r'[^a-zA-Z0-9]+')
+
+# Files at least this large are decoded straight from an mmap of the file
+_MMAP_MIN_SIZE = 1 << 20
+
+
+def _parse_tool_content(content: str) -> Any:
+    """Decode the text content of an MCP tool result.
+    
+    Servers serialize dict results as JSON; other results (such as lists)
+    arrive as their str() form, which is parsed as a Python literal.
+    """
+    try:
+        return _json_loads(content)
+    except json.JSONDecodeError:  # orjson.JSONDecodeError subclasses this
+        return ast.literal_eval(content)
+
+
+def _read_text(path: str) -> str:
+    """Read a text file; run via asyncio.to_thread from async code.
+    
+    Large files (such as vendored generated source) are mapped and decoded
+    from the page cache, skipping the intermediate bytes copy of ``read()``.
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < _MMAP_MIN_SIZE:
+            return f.read().decode()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return str(view, 'utf-8')
+
+
+def _mcp_tool_call(request_id: str, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+    """Build a JSON-RPC ``tools/call`` request."""
+    return {
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "method": "tools/call",
+        "params": {"name": tool_name, "arguments": arguments}
+    }
+
+
+class MCPSession:
+    """
+    Client session bound to one MCP server.
+    
+    The MCP handshake (initialize) is performed once when the session is
+    opened, unless the serverInfo of an earlier handshake with the server is
+    passed in; every later request reuses the session.
+    """
+
+    def __init__(self, server, server_info: Optional[Dict] = None):
+        self.server = server
+        self.server_info = server_info
+
+    async def open(self):
+        """Perform the MCP initialize handshake for this session, unless the serverInfo is already known."""
+        if self.server_info is not None:
+            return self
+        response = await self.server.handle_mcp_request({
+            "jsonrpc": "2.0",
+            "id": "session_init",
+            "method": "initialize",
+            "params": {"protocolVersion": "2024-11-05", "capabilities": {}}
+        })
+        self.server_info = response.get("result", {}).get("serverInfo")
+        return self
+
+    async def send(self, request):
+        """Send a JSON-RPC request (or batch) over this session."""
+        return await self.server.handle_mcp_request(request)
+
+
+class MCPSessionPool:
+    """
+    Pool of reusable MCP sessions, one queue per server.
+    
+    Up to ``max_sessions`` sessions are opened per server; callers beyond
+    that wait for a session to be released. Stateful tools can ask for a
+    private session with ``no_share=True``, which is never returned to the pool.
+    
+    At most ``max_inflight`` sessions are borrowed at once across all servers,
+    so many concurrent ``implement_feature`` calls are pipelined with
+    back-pressure instead of flooding the servers.
+    
+    Queues and the in-flight semaphore belong to the event loop they were
+    created on, so they are created lazily on the running loop and replaced
+    when the pool is used from a new one.
+    """
+
+    def __init__(self, servers: Dict[str, Any], max_sessions: int = 4, max_inflight: int = 8,
+                 server_info: Optional[Dict[str, Dict]] = None):
+        self._servers = servers
+        self._max_sessions = max_sessions
+        self._max_inflight = max_inflight
+        # serverInfo by server name from earlier handshakes; new sessions reuse it
+        self._server_info = server_info if server_info is not None else {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pools: Dict[str, asyncio.Queue] = {}
+        self._opened: Dict[str, int] = {}
+        self._inflight: Optional[asyncio.Semaphore] = None
+
+    def _bind(self):
+        """Create the pool's queues and semaphore on the running loop, dropping those of an earlier loop."""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self.close()
+            self._loop = loop
+            self._inflight = asyncio.Semaphore(self._max_inflight)
+
+    def close(self):
+        """Drop pooled sessions and loop-bound state; the next use starts afresh."""
+        self._loop = None
+        self._pools = {}
+        self._opened = {}
+        self._inflight = None
+
+    def __contains__(self, server_name: str) -> bool:
+        return server_name in self._servers
+
+    def server(self, server_name: str):
+        """Return the server registered as ``server_name``."""
+        return self._servers[server_name]
+
+    def inflight(self) -> asyncio.Semaphore:
+        """Semaphore bounding in-flight calls across all servers, for calls made without a session."""
+        self._bind()
+        return self._inflight
+
+    async def _open(self, server_name: str) -> MCPSession:
+        """Open a session, reusing the serverInfo of an earlier handshake with the server."""
+        session = await MCPSession(self._servers[server_name], self._server_info.get(server_name)).open()
+        if session.server_info is not None:
+            self._server_info.setdefault(server_name, session.server_info)
+        return session
+
+    @asynccontextmanager
+    async def acquire(self, server_name: str, no_share: bool = False):
+        """Borrow a session for ``server_name`` for the duration of the block."""
+        self._bind()
+        
+        async with self._inflight:
+            if no_share:
+                yield await self._open(server_name)
+                return
+            
+            pool = self._pools.setdefault(server_name, asyncio.Queue())
+            if pool.empty() and self._opened.get(server_name, 0) < self._max_sessions:
+                self._opened[server_name] = self._opened.get(server_name, 0) + 1
+                try:
+                    session = await self._open(server_name)
+                except Exception:
+                    self._opened[server_name] -= 1
+                    raise
+            else:
+                session = await pool.get()
+            
+            try:
+                yield session
+            finally:
+                pool.put_nowait(session)
+
 
 class MCPOrchestrator:
     """
@@ -31,19 +205,61 @@ class MCPOrchestrator:
         self.impl_server = ImplementationMCPServer(Path("./workspaces"))
         self.monitor_server = MonitoringMCPServer()
         
-        # Initialize all servers
-        asyncio.create_task(self._initialize_servers())
-
-    async def _initialize_servers(self):
-        """Initialize all MCP servers."""
+        # (name, server) pairs in reporting order
+        self._servers = (
+            ("specification", self.spec_server),
+            ("docker", self.docker_server),
+            ("implementation", self.impl_server),
+            ("monitoring", self.monitor_server)
+        )
+        
+        # Loaded specifications by domain; specs do not change during a session
+        self._spec_cache: Dict[str, Dict] = {}
+        
+        # Enhanced specs by domain, with the scenario count they were enhanced from
+        self._enhanced: Dict[str, tuple] = {}
+        
+        # serverInfo from each server's initialize response, filled when it starts
+        self._server_info: Dict[str, Dict] = {}
+        
+        # Reusable MCP sessions for tool calls
+        self._sessions = MCPSessionPool(dict(self._servers), server_info=self._server_info)
+        
+        # Servers are started lazily, on first use; one start task per server,
+        # on the loop in _started_loop
+        self._started: Dict[str, asyncio.Task] = {}
+        self._started_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def close(self):
+        """Drop pooled sessions and start tasks so the orchestrator can be reused on a new event loop."""
+        self._sessions.close()
+        self._started = {}
+        self._started_loop = None
+
+    async def _ensure(self, *server_names: str):
+        """Start the named MCP servers if they have not been started yet.
+        
+        Concurrent callers await the same start task, so each server is
+        started at most once per event loop.
+        """
+        if asyncio.get_running_loop() is not self._started_loop:
+            # Tasks of an earlier loop cannot be awaited on this one
+            self._started = {}
+            self._started_loop = asyncio.get_running_loop()
+        for server_name in server_names:
+            if server_name not in self._started:
+                self._started[server_name] = asyncio.create_task(self._start_server(server_name))
+        await asyncio.gather(*(self._started[server_name] for server_name in server_names))
+
+    async def _start_server(self, server_name: str):
+        """Start one MCP server and cache its serverInfo."""
+        server = self._sessions.server(server_name)
         try:
-            await self.spec_server.start_server()
-            await self.docker_server.start_server() 
-            await self.impl_server.start_server()
-            await self.monitor_server.start_server()
-            print("🔧 All MCP servers initialized")
+            await server.start_server()
+            if server_name not in self._server_info:
+                await self._fetch_server_info(server_name, server)
         except Exception as e:
-            print(f"⚠️ Server initialization warning: {e}")
+            print(f"⚠️ Server initialization warning ({server_name}): {e}")
 
     async def implement_feature(self, feature_request: str, domain: str = None) -> Dict:
         """Complete feature implementation flow using MCP protocol."""
@@ -52,8 +268,7 @@ class MCPOrchestrator:
 
         # Derive domain from feature_request if not provided
         if not domain:
-            import re
-            domain = re.sub(r'[^a-zA-Z0-9]+', '_', feature_request).lower().strip('_')
+            domain = _DOMAIN_SANITIZE_RE.sub('_', feature_request).lower().strip('_')
             if not domain or domain[0].isdigit():
                 domain = f"service_{domain}"
 
@@ -70,17 +285,23 @@ class MCPOrchestrator:
             print("🔨 Phase 3: Generating implementation...")
             impl_result = await self._implement_specification_mcp(enhanced_spec)
 
-            # Phase 4: Generate Docker configuration using MCP
+            # Phases 4-6 only read impl_result, so they run concurrently:
+            # Docker configuration, verification and monitoring setup
             print("🐳 Phase 4: Generating Docker configuration...")
-            docker_result = await self._generate_docker_mcp(impl_result)
-
-            # Phase 5: Verification
             print("✅ Phase 5: Verifying implementation...")
-            verification = await self._verify_implementation_mcp(impl_result)
-
-            # Phase 6: Setup monitoring
             print("📊 Phase 6: Setting up monitoring...")
-            monitoring = await self._setup_monitoring_mcp(impl_result)
+            phase_results = await asyncio.gather(
+                self._generate_docker_mcp(impl_result),
+                self._verify_implementation_mcp(impl_result),
+                self._setup_monitoring_mcp(impl_result),
+                return_exceptions=True
+            )
+            
+            # A failing phase is reported in its own result instead of discarding the others
+            docker_result, verification, monitoring = (
+                {"status": "failed", "error": str(result)} if isinstance(result, Exception) else result
+                for result in phase_results
+            )
 
             return {
                 "feature_request": feature_request,
@@ -107,26 +328,25 @@ class MCPOrchestrator:
     async def _load_specification_mcp(self, domain: str) -> Dict:
         """Load specification using MCP protocol."""
         
-        request = {
-            "jsonrpc": "2.0",
-            "id": "load_spec_1",
-            "method": "tools/call",
-            "params": {
-                "name": "get_scenarios",
-                "arguments": {
-                    "domain": domain,
-                    "include_constraints": True
-                }
-            }
-        }
+        await self._ensure("specification")
+        
+        # Callers mutate the returned spec, so hand out copies of the cached one
+        if domain in self._spec_cache:
+            return copy.deepcopy(self._spec_cache[domain])
+        
+        request = _mcp_tool_call("load_spec_1", "get_scenarios", {
+            "domain": domain,
+            "include_constraints": True
+        })
 
-        response = await self.spec_server.handle_mcp_request(request)
+        async with self._sessions.acquire("specification") as session:
+            response = await session.send(request)
         
         if 'result' in response:
             # Parse the response content (returned as text)
             content = response['result']['content'][0]['text']
             try:
-                spec_data = eval(content)  # Convert string repr to dict
+                spec_data = _parse_tool_content(content)
                 
                 if "error" in spec_data:
                     # Create basic specification structure
@@ -138,6 +358,7 @@ class MCPOrchestrator:
                     }
                 
                 spec_data["status"] = "loaded"
+                self._spec_cache[domain] = copy.deepcopy(spec_data)
                 return spec_data
                 
             except Exception as e:
@@ -157,9 +378,20 @@ class MCPOrchestrator:
                 "status": "error"
             }
 
+    def invalidate_spec(self, domain: str = None):
+        """Drop the cached (and enhanced) specification for a domain, or all of them."""
+        if domain is None:
+            self._spec_cache.clear()
+            self._enhanced.clear()
+        else:
+            self._spec_cache.pop(domain, None)
+            self._enhanced.pop(domain, None)
+
     async def _enhance_specification_mcp(self, spec: Dict, feature_request: str) -> Dict:
         """Enhance specification using AI through MCP."""
         
+        await self._ensure("specification")
+        
         scenarios = spec.get("scenarios", [])
         if not scenarios:
             # Generate initial scenarios if none exist
@@ -178,50 +410,45 @@ class MCPOrchestrator:
             spec["status"] = "enhanced"
             return spec
 
-        # Enhance existing scenarios if present
+        # Repeat enhancements of an unchanged spec reuse the previous result
+        enhancement_key = len(scenarios)
+        previous = self._enhanced.get(spec["domain"])
+        if previous and previous[0] == enhancement_key:
+            return copy.deepcopy(previous[1])
+
+        # Enhance existing scenarios if present; coverage analysis and edge case
+        # generation go to the specification server as one JSON-RPC batch
         print("🔍 Analyzing scenario coverage...")
+        print("🎯 Generating edge case scenarios...")
         
-        coverage_request = {
-            "jsonrpc": "2.0",
-            "id": "coverage_1",
-            "method": "tools/call",
-            "params": {
-                "name": "analyze_coverage",
-                "arguments": {
-                    "domain": spec["domain"],
-                    "suggest_missing": True,
-                    "coverage_goals": ["functional", "edge_cases", "error_handling"]
-                }
-            }
-        }
+        coverage_request = _mcp_tool_call("coverage_1", "analyze_coverage", {
+            "domain": spec["domain"],
+            "suggest_missing": True,
+            "coverage_goals": ["functional", "edge_cases", "error_handling"]
+        })
 
-        coverage_response = await self.spec_server.handle_mcp_request(coverage_request)
+        # Generate edge cases to improve coverage
+        edge_cases_request = _mcp_tool_call("edge_cases_1", "generate_edge_cases", {
+            "domain": spec["domain"],
+            "edge_case_types": ["error", "boundary", "security"]
+        })
+
+        async with self._sessions.acquire("specification") as session:
+            batch_response = await session.send([coverage_request, edge_cases_request])
+        if isinstance(batch_response, dict):
+            # The whole batch was rejected
+            batch_response = [batch_response]
+        responses = {response.get("id"): response for response in batch_response}
+        coverage_response = responses.get("coverage_1", {})
+        edge_response = responses.get("edge_cases_1", {})
         
         if 'result' in coverage_response:
             print("✅ Coverage analysis completed")
-
-        # Generate edge cases to improve coverage
-        print("🎯 Generating edge case scenarios...")
-        
-        edge_cases_request = {
-            "jsonrpc": "2.0",
-            "id": "edge_cases_1", 
-            "method": "tools/call",
-            "params": {
-                "name": "generate_edge_cases",
-                "arguments": {
-                    "domain": spec["domain"],
-                    "edge_case_types": ["error", "boundary", "security"]
-                }
-            }
-        }
-
-        edge_response = await self.spec_server.handle_mcp_request(edge_cases_request)
         
         if 'result' in edge_response:
             try:
                 content = edge_response['result']['content'][0]['text']
-                edge_cases = eval(content)
+                edge_cases = _parse_tool_content(content)
                 if isinstance(edge_cases, list) and edge_cases:
                     spec["scenarios"].extend(edge_cases[:3])  # Add up to 3 edge cases
                     print(f"✅ Added {len(edge_cases[:3])} edge case scenarios")
@@ -229,11 +456,15 @@ class MCPOrchestrator:
                 print(f"⚠️ Edge case parsing error: {e}")
 
         spec["status"] = "enhanced"
+        if 'result' in edge_response:
+            self._enhanced[spec["domain"]] = (enhancement_key, copy.deepcopy(spec))
         return spec
 
     async def _implement_specification_mcp(self, spec: Dict) -> Dict:
         """Implement specification using MCP (still uses old server for now)."""
         
+        await self._ensure("implementation")
+        
         # Note: ImplementationMCPServer is not converted to real MCP yet
         # For now, use the existing direct call approach
         
@@ -257,48 +488,34 @@ class MCPOrchestrator:
     async def _generate_docker_mcp(self, impl_result: Dict) -> Dict:
         """Generate Docker configuration using MCP protocol."""
         
+        await self._ensure("docker")
+        
         # First analyze the implementation code for dependencies
         workspace_id = impl_result["workspace_id"]
         workspace_path = self.impl_server.active_workspaces[workspace_id]["path"]
         
-        # Read implementation files
-        try:
-            impl_files = list(workspace_path.glob("*.py"))
-            if not impl_files:
-                raise Exception("No implementation files found")
-                
-            impl_file = [f for f in impl_files if not f.name.startswith("test_") and f.name != "__init__.py"][0]
-            test_files = [f for f in impl_files if f.name.startswith("test_")]
-            
-            with open(impl_file, 'r') as f:
-                impl_code = f.read()
-                
-            test_code = ""
-            if test_files:
-                with open(test_files[0], 'r') as f:
-                    test_code = f.read()
-
-        except Exception as e:
-            print(f"⚠️ Could not read implementation files: {e}")
-            return {"status": "failed", "error": str(e)}
+        # Use the source generated in Phase 3; read the workspace only when it is missing
+        implementation = impl_result.get("implementation") or {}
+        impl_code = implementation.get("main_module")
+        test_code = implementation.get("test_module") or ""
+        
+        if not impl_code:
+            try:
+                impl_code, test_code = await self._read_workspace_code(workspace_path)
+            except Exception as e:
+                print(f"⚠️ Could not read implementation files: {e}")
+                return {"status": "failed", "error": str(e)}
 
         # Analyze dependencies using MCP
         print("🔍 Analyzing code dependencies...")
         
-        analyze_request = {
-            "jsonrpc": "2.0",
-            "id": "analyze_deps_1",
-            "method": "tools/call",
-            "params": {
-                "name": "analyze_dependencies",
-                "arguments": {
-                    "implementation_code": impl_code,
-                    "test_code": test_code
-                }
-            }
-        }
+        analyze_request = _mcp_tool_call("analyze_deps_1", "analyze_dependencies", {
+            "implementation_code": impl_code,
+            "test_code": test_code
+        })
 
-        analyze_response = await self.docker_server.handle_mcp_request(analyze_request)
+        async with self._sessions.acquire("docker") as session:
+            analyze_response = await session.send(analyze_request)
         
         if 'result' not in analyze_response:
             print(f"⚠️ Dependency analysis failed: {analyze_response.get('error', 'Unknown error')}")
@@ -306,7 +523,7 @@ class MCPOrchestrator:
 
         try:
             analysis_content = analyze_response['result']['content'][0]['text']
-            code_analysis = eval(analysis_content)
+            code_analysis = _parse_tool_content(analysis_content)
         except Exception as e:
             print(f"⚠️ Analysis parsing error: {e}")
             return {"status": "failed", "error": f"Analysis parsing error: {e}"}
@@ -314,25 +531,18 @@ class MCPOrchestrator:
         # Generate Dockerfile using MCP
         print("🐳 Generating optimized Dockerfile...")
         
-        dockerfile_request = {
-            "jsonrpc": "2.0",
-            "id": "dockerfile_1",
-            "method": "tools/call",
-            "params": {
-                "name": "generate_dockerfile",
-                "arguments": {
-                    "code_analysis": code_analysis,
-                    "constraints": {
-                        "security": ["non-root-user", "minimal-attack-surface"],
-                        "performance": ["layer-caching", "multi-stage-build"]
-                    },
-                    "environment": "production",
-                    "optimization_goals": ["security", "performance", "size"]
-                }
-            }
-        }
+        dockerfile_request = _mcp_tool_call("dockerfile_1", "generate_dockerfile", {
+            "code_analysis": code_analysis,
+            "constraints": {
+                "security": ["non-root-user", "minimal-attack-surface"],
+                "performance": ["layer-caching", "multi-stage-build"]
+            },
+            "environment": "production",
+            "optimization_goals": ["security", "performance", "size"]
+        })
 
-        dockerfile_response = await self.docker_server.handle_mcp_request(dockerfile_request)
+        async with self._sessions.acquire("docker") as session:
+            dockerfile_response = await session.send(dockerfile_request)
         
         if 'result' not in dockerfile_response:
             print(f"⚠️ Dockerfile generation failed: {dockerfile_response.get('error', 'Unknown error')}")
@@ -343,29 +553,22 @@ class MCPOrchestrator:
         # Generate docker-compose using MCP
         print("📦 Generating docker-compose configuration...")
         
-        compose_request = {
-            "jsonrpc": "2.0",
-            "id": "compose_1",
-            "method": "tools/call", 
-            "params": {
-                "name": "generate_docker_compose",
-                "arguments": {
-                    "services": [
-                        {
-                            "name": impl_result["specification"]["domain"],
-                            "type": "web" if code_analysis.get("has_web_server") else "service",
-                            "dependencies": list(code_analysis.get("dependencies", [])),
-                            "ports": code_analysis.get("ports", [8000])
-                        }
-                    ],
-                    "networking": {"internal": True},
-                    "volumes": ["data:/app/data"],
-                    "environment": "production"
+        compose_request = _mcp_tool_call("compose_1", "generate_docker_compose", {
+            "services": [
+                {
+                    "name": impl_result["specification"]["domain"],
+                    "type": "web" if code_analysis.get("has_web_server") else "service",
+                    "dependencies": list(code_analysis.get("dependencies", [])),
+                    "ports": code_analysis.get("ports", [8000])
                 }
-            }
-        }
+            ],
+            "networking": {"internal": True},
+            "volumes": ["data:/app/data"],
+            "environment": "production"
+        })
 
-        compose_response = await self.docker_server.handle_mcp_request(compose_request)
+        async with self._sessions.acquire("docker") as session:
+            compose_response = await session.send(compose_request)
         
         compose_content = ""
         if 'result' in compose_response:
@@ -373,10 +576,12 @@ class MCPOrchestrator:
         else:
             print(f"⚠️ Compose generation warning: {compose_response.get('error', 'Unknown error')}")
 
-        # Save Docker files to workspace
-        (workspace_path / "Dockerfile.mcp").write_text(dockerfile_content)
-        if compose_content:
-            (workspace_path / "docker-compose.mcp.yml").write_text(compose_content)
+        # Save Docker files to workspace concurrently without blocking the event loop
+        await asyncio.gather(
+            asyncio.to_thread((workspace_path / "Dockerfile.mcp").write_text, dockerfile_content),
+            asyncio.to_thread((workspace_path / "docker-compose.mcp.yml").write_text, compose_content)
+            if compose_content else asyncio.sleep(0)
+        )
 
         return {
             "dockerfile": dockerfile_content,
@@ -387,9 +592,36 @@ class MCPOrchestrator:
             "mcp_generated": True
         }
 
+    async def _read_workspace_code(self, workspace_path: Path) -> tuple:
+        """Read the implementation and test sources from a workspace directory."""
+        
+        # Classify the workspace's Python files in a single directory scan
+        impl_file = None
+        test_file = None
+        with os.scandir(workspace_path) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".py"):
+                    continue
+                if entry.name.startswith("test_"):
+                    test_file = test_file or entry.path
+                elif entry.name != "__init__.py":
+                    impl_file = impl_file or entry.path
+        
+        if impl_file is None:
+            raise Exception("No implementation files found")
+        
+        # Read the files in worker threads so disk I/O does not block the event loop
+        impl_code, test_code = await asyncio.gather(
+            asyncio.to_thread(_read_text, impl_file),
+            asyncio.to_thread(_read_text, test_file) if test_file else asyncio.sleep(0, result="")
+        )
+        return impl_code, test_code
+
     async def _verify_implementation_mcp(self, impl_result: Dict) -> Dict:
         """Verify implementation using MCP (placeholder for now)."""
         
+        await self._ensure("implementation")
+        
         workspace_id = impl_result["workspace_id"]
         spec = impl_result["specification"]
         constraints = spec.get("constraints", {})
@@ -406,11 +638,16 @@ class MCPOrchestrator:
     async def _setup_monitoring_mcp(self, impl_result: Dict) -> Dict:
         """Setup monitoring using MCP (placeholder for now)."""
         
+        await self._ensure("monitoring")
+        
         workspace_id = impl_result["workspace_id"]
         
-        # For now, use existing monitoring (not yet converted to MCP)
-        health = await self.monitor_server.get_health_status(workspace_id)
-        predictions = await self.monitor_server.predict_failures(workspace_id)
+        # For now, use existing monitoring (not yet converted to MCP).
+        # Both queries depend only on the workspace, so run them concurrently.
+        health, predictions = await asyncio.gather(
+            self.monitor_server.get_health_status(workspace_id),
+            self.monitor_server.predict_failures(workspace_id)
+        )
         
         return {
             "workspace_id": workspace_id,
@@ -428,44 +665,30 @@ class MCPOrchestrator:
             "servers": {}
         }
 
-        # Get status from each MCP server
-        for server_name, server in [
-            ("specification", self.spec_server),
-            ("docker", self.docker_server), 
-            ("implementation", self.impl_server),
-            ("monitoring", self.monitor_server)
-        ]:
-            try:
-                # Try to get server info via MCP
-                init_request = {
-                    "jsonrpc": "2.0",
-                    "id": f"status_{server_name}",
-                    "method": "initialize",
-                    "params": {"protocolVersion": "2024-11-05", "capabilities": {}}
-                }
-                
-                response = await server.handle_mcp_request(init_request)
-                
-                if 'result' in response:
-                    status["servers"][server_name] = {
-                        "status": "active",
-                        "name": response['result']['serverInfo']['name'],
-                        "version": response['result']['serverInfo'].get('version', '1.0.0'),
-                        "mcp_enabled": True
-                    }
-                else:
-                    status["servers"][server_name] = {
-                        "status": "error", 
+        await self._ensure(*(server_name for server_name, _ in self._servers))
+
+        # Started servers are reported from the cached serverInfo;
+        # only the rest are queried via MCP, concurrently
+        uncached = [(server_name, server) for server_name, server in self._servers
+                    if server_name not in self._server_info]
+        results = await asyncio.gather(
+            *(self._fetch_server_info(server_name, server) for server_name, server in uncached),
+            return_exceptions=True
+        )
+        fetched = {server_name: result for (server_name, _), result in zip(uncached, results)}
+
+        for server_name, _ in self._servers:
+            if server_name in self._server_info:
+                result = self._active_status(self._server_info[server_name])
+            else:
+                result = fetched[server_name]
+                if isinstance(result, Exception):
+                    result = {
+                        "status": "error",
                         "mcp_enabled": False,
-                        "error": response.get('error', 'Unknown error')
+                        "error": str(result)
                     }
-                    
-            except Exception as e:
-                status["servers"][server_name] = {
-                    "status": "error",
-                    "mcp_enabled": False,
-                    "error": str(e)
-                }
+            status["servers"][server_name] = result
 
         # Add workspace info
         if hasattr(self.impl_server, 'active_workspaces'):
@@ -473,17 +696,42 @@ class MCPOrchestrator:
         
         return status
 
+    async def _fetch_server_info(self, server_name: str, server) -> Dict:
+        """Initialize a server via MCP, cache its serverInfo and return its status entry."""
+        init_request = {
+            "jsonrpc": "2.0",
+            "id": f"status_{server_name}",
+            "method": "initialize",
+            "params": {"protocolVersion": "2024-11-05", "capabilities": {}}
+        }
+        
+        response = await server.handle_mcp_request(init_request)
+        
+        if 'result' in response:
+            self._server_info[server_name] = response['result']['serverInfo']
+            return self._active_status(self._server_info[server_name])
+        return {
+            "status": "error", 
+            "mcp_enabled": False,
+            "error": response.get('error', 'Unknown error')
+        }
+
+    @staticmethod
+    def _active_status(server_info: Dict) -> Dict:
+        """Build the status entry for a server that answered initialize."""
+        return {
+            "status": "active",
+            "name": server_info['name'],
+            "version": server_info.get('version', '1.0.0'),
+            "mcp_enabled": True
+        }
+
     async def list_available_tools(self) -> Dict[str, List[Dict]]:
         """List all available MCP tools across servers."""
         
         tools_by_server = {}
-        
-        for server_name, server in [
-            ("specification", self.spec_server),
-            ("docker", self.docker_server),
-            ("implementation", self.impl_server),
-            ("monitoring", self.monitor_server)
-        ]:
+
+        async def list_tools(server_name, server):
             tools_request = {
                 "jsonrpc": "2.0",
                 "id": f"tools_{server_name}",
@@ -491,44 +739,54 @@ class MCPOrchestrator:
                 "params": {}
             }
             
-            try:
-                response = await server.handle_mcp_request(tools_request)
-                if 'result' in response:
-                    tools_by_server[server_name] = response['result']['tools']
-                else:
-                    tools_by_server[server_name] = []
-            except Exception as e:
-                tools_by_server[server_name] = [{"error": str(e)}]
+            await self._ensure(server_name)
+            async with self._sessions.acquire(server_name) as session:
+                response = await session.send(tools_request)
+            if 'result' in response:
+                return response['result']['tools']
+            return []
+
+        # Query every MCP server concurrently
+        results = await asyncio.gather(
+            *(list_tools(server_name, server) for server_name, server in self._servers),
+            return_exceptions=True
+        )
+
+        for (server_name, _), result in zip(self._servers, results):
+            if isinstance(result, Exception):
+                result = [{"error": str(result)}]
+            tools_by_server[server_name] = result
         
         return tools_by_server
 
-    async def call_mcp_tool(self, server_name: str, tool_name: str, arguments: Dict) -> Dict:
-        """Call any MCP tool by name."""
+    async def call_mcp_tool(self, server_name: str, tool_name: str, arguments: Dict, no_share: bool = False) -> Dict:
+        """Call any MCP tool by name.
         
-        server_map = {
-            "specification": self.spec_server,
-            "docker": self.docker_server,
-            "implementation": self.impl_server,
-            "monitoring": self.monitor_server
-        }
+        Pass ``no_share=True`` for stateful tools that must not reuse a pooled session.
+        """
         
-        if server_name not in server_map:
+        if server_name not in self._sessions:
             return {"error": f"Unknown server: {server_name}"}
         
-        server = server_map[server_name]
+        await self._ensure(server_name)
+        request_id = f"call_{tool_name}"
         
-        request = {
-            "jsonrpc": "2.0",
-            "id": f"call_{tool_name}",
-            "method": "tools/call",
-            "params": {
-                "name": tool_name,
-                "arguments": arguments
-            }
-        }
+        # In-process servers: call the tool directly, skipping the JSON-RPC
+        # request envelope and method dispatch but not the server's logging
+        # and serialization, under the same in-flight bound as sessions
+        call_tool = getattr(self._sessions.server(server_name), "call_tool", None)
+        if call_tool is not None and not no_share:
+            try:
+                async with self._sessions.inflight():
+                    return await call_tool(tool_name, arguments, request_id)
+            except Exception as e:
+                return {"error": str(e)}
+        
+        request = _mcp_tool_call(request_id, tool_name, arguments)
         
         try:
-            response = await server.handle_mcp_request(request)
+            async with self._sessions.acquire(server_name, no_share=no_share) as session:
+                response = await session.send(request)
             return response
         except Exception as e:
             return {"error": str(e)}
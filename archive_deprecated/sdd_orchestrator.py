@@ -1,9 +1,14 @@
+import asyncio
+import re
 from pathlib import Path
 from typing import Dict
 from mcp_servers.specification_server import SpecificationMCPServer
 from mcp_servers.implementation_server import ImplementationMCPServer
 from mcp_servers.monitoring_server import MonitoringMCPServer
 
+# Runs of characters that are not allowed in a domain name
+_DOMAIN_SANITIZE_RE = re.compile(r'[^a-zA-Z0-9]+')
+
 
 class SDDOrchestrator:
     """Orchestrates the specification to implementation flow"""
@@ -22,8 +27,7 @@ class SDDOrchestrator:
         # Derive domain from feature_request if not provided
         if not domain:
             # Convert feature request to a valid domain name (snake_case)
-            import re
-            domain = re.sub(r'[^a-zA-Z0-9]+', '_', feature_request).lower().strip('_')
+            domain = _DOMAIN_SANITIZE_RE.sub('_', feature_request).lower().strip('_')
             if not domain or domain[0].isdigit():
                 domain = f"service_{domain}"
 
@@ -35,13 +39,13 @@ class SDDOrchestrator:
         print("🔨 Phase 2: Generating implementation...")
         impl_result = await self._implement_specification(spec_result)
 
-        # Phase 3: Verification
+        # Phases 3 and 4 both only read impl_result, so run them concurrently
         print("✅ Phase 3: Verifying constraints...")
-        verification = await self._verify_implementation(impl_result)
-
-        # Phase 4: Monitoring Setup
         print("📊 Phase 4: Setting up monitoring...")
-        monitoring = await self._setup_monitoring(impl_result)
+        verification, monitoring = await asyncio.gather(
+            self._verify_implementation(impl_result),
+            self._setup_monitoring(impl_result)
+        )
 
         return {
             "feature_request": feature_request,
@@ -109,11 +113,11 @@ class SDDOrchestrator:
         
         workspace_id = impl_result["workspace_id"]
         
-        # Get initial health status
-        health = await self.monitor_server.get_health_status(workspace_id)
-        
-        # Set up predictive monitoring
-        predictions = await self.monitor_server.predict_failures(workspace_id)
+        # Get initial health status and set up predictive monitoring concurrently
+        health, predictions = await asyncio.gather(
+            self.monitor_server.get_health_status(workspace_id),
+            self.monitor_server.predict_failures(workspace_id)
+        )
         
         return {
             "workspace_id": workspace_id,
@@ -6,6 +6,34 @@ import asyncio
 from pathlib import Path
 import yaml
 
+# Demo specification, parsed once at import
+SPECIFICATION_YAML = """
+feature: Task Manager API
+scenarios:
+  - name: Create a task
+    given: User is authenticated
+    when: User creates task "Buy groceries"
+    then:
+      - Task exists with title "Buy groceries"
+      - Task has status "pending"
+      - Task has unique ID
+      
+  - name: Complete a task
+    given: Task "Buy groceries" exists with status "pending"
+    when: User marks task as complete
+    then:
+      - Task status is "completed"
+      - Completion timestamp is set
+      
+constraints:
+  performance:
+    - All operations complete in < 100ms
+  scale:
+    - Support 10,000 concurrent users
+"""
+
+SPECIFICATION = yaml.safe_load(SPECIFICATION_YAML)
+
 async def quickstart_demo():
     """Run a simple SDD demonstration"""
     
@@ -13,30 +41,7 @@ async def quickstart_demo():
     print("=" * 50)
     
     # Step 1: Load specification
-    spec = yaml.safe_load("""
-    feature: Task Manager API
-    scenarios:
-      - name: Create a task
-        given: User is authenticated
-        when: User creates task "Buy groceries"
-        then:
-          - Task exists with title "Buy groceries"
-          - Task has status "pending"
-          - Task has unique ID
-          
-      - name: Complete a task
-        given: Task "Buy groceries" exists with status "pending"
-        when: User marks task as complete
-        then:
-          - Task status is "completed"
-          - Completion timestamp is set
-          
-    constraints:
-      performance:
-        - All operations complete in < 100ms
-      scale:
-        - Support 10,000 concurrent users
-    """)
+    spec = SPECIFICATION
     
     print("\n📋 Specification loaded!")
     print(f"Scenarios: {len(spec['scenarios'])}")
@@ -3,9 +3,13 @@ Unified AI client interface supporting multiple providers (OpenAI, Anthropic).
 Allows users to specify provider and model through configuration or parameters.
 """
 
+import functools
 import os
-from typing import List, Dict, Any, Optional
-from src.core import openai_client, anthropic_client
+import time
+from types import ModuleType
+from typing import List, Dict, Any, Callable, Optional, Tuple
+from src.core import completion_cache
+from src.core.env import DYNAMIC_ENV
 
 # Default models for each provider (latest as of 2025)
 DEFAULT_MODELS = {
@@ -13,6 +17,16 @@ DEFAULT_MODELS = {
     "anthropic": "claude-3-5-sonnet-20241022"
 }
 
+# Models by task tier: "fast" for classification-style steps where latency
+# matters more than depth, "deep" for synthesis and plan generation
+MODEL_TIERS = {
+    "fast": {
+        "openai": "gpt-3.5-turbo",
+        "anthropic": "claude-3-haiku-20240307"
+    },
+    "deep": DEFAULT_MODELS
+}
+
 # Available models by provider
 AVAILABLE_MODELS = {
     "openai": [
@@ -54,10 +68,44 @@ AVAILABLE_MODELS = {
     ]
 }
 
+# Hashed lookups for per-call provider/model validation
+_SUPPORTED_PROVIDERS = frozenset(AVAILABLE_MODELS)
+_MODEL_INDEX = {provider: frozenset(models) for provider, models in AVAILABLE_MODELS.items()}
+
+# Provider client modules, imported on first use so only the SDK in use is loaded
+_PROVIDERS: Dict[str, ModuleType] = {}
+
+def _provider_client(provider: str) -> ModuleType:
+    """Return the client module for a validated provider, importing it on first use."""
+    client = _PROVIDERS.get(provider)
+    if client is None:
+        if provider == "openai":
+            from src.core import openai_client as client
+        else:
+            from src.core import anthropic_client as client
+        _PROVIDERS[provider] = client
+    return client
+
+# The environment is treated as fixed for the life of the process, so default
+# lookups are cached; set SDD_DYNAMIC_ENV=1 to re-read it on every call
+def _env_cached(func):
+    """Cache an environment-derived value unless SDD_DYNAMIC_ENV=1."""
+    if DYNAMIC_ENV:
+        return func
+    return functools.lru_cache(maxsize=None)(func)
+
+def _env_reset():
+    """Forget cached environment lookups (for tests that change the environment)."""
+    for func in (get_default_provider, get_default_model):
+        if hasattr(func, "cache_clear"):
+            func.cache_clear()
+
+@_env_cached
 def get_default_provider() -> str:
     """Get the default provider from environment or fallback to OpenAI."""
     return os.getenv("AI_PROVIDER", "openai").lower()
 
+@_env_cached
 def get_default_model(provider: Optional[str] = None) -> str:
     """Get the default model for a provider."""
     if provider is None:
@@ -71,12 +119,46 @@ def get_default_model(provider: Optional[str] = None) -> str:
     
     return DEFAULT_MODELS.get(provider, DEFAULT_MODELS["openai"])
 
+def _resolve_provider_model(provider: Optional[str], model: Optional[str],
+                            tier: Optional[str] = None) -> Tuple[str, str]:
+    """Apply defaults to provider/model and validate the combination.
+    
+    An explicit model wins over a tier, which wins over the configured default model.
+    """
+    if provider is None:
+        provider = get_default_provider()
+    
+    provider = provider.lower()
+    
+    if model is None and tier is not None:
+        if tier not in MODEL_TIERS:
+            raise ValueError(f"Unknown tier: {tier}. Must be one of: {', '.join(MODEL_TIERS)}")
+        model = MODEL_TIERS[tier].get(provider)
+    
+    if model is None:
+        model = get_default_model(provider)
+    
+    # Validate provider
+    if provider not in _SUPPORTED_PROVIDERS:
+        raise ValueError(f"Unsupported provider: {provider}. Must be 'openai' or 'anthropic'")
+    
+    # Validate model for provider
+    if model not in _MODEL_INDEX[provider]:
+        available = ", ".join(AVAILABLE_MODELS[provider])
+        raise ValueError(f"Model '{model}' not available for {provider}. Available: {available}")
+    
+    return provider, model
+
 def chat_completion(
     messages: List[Dict[str, str]], 
     provider: Optional[str] = None,
     model: Optional[str] = None,
     temperature: float = 0.0,
-    max_tokens: Optional[int] = None
+    max_tokens: Optional[int] = None,
+    batch: bool = False,
+    system: Optional[str] = None,
+    tier: Optional[str] = None,
+    cache: bool = True
 ) -> str:
     """
     Send messages to the specified AI provider and return the response.
@@ -87,50 +169,194 @@ def chat_completion(
         model: Model name. Defaults to provider default or env {PROVIDER}_MODEL
         temperature: Sampling temperature (0.0 to 1.0). Note: o-series reasoning models may ignore this
         max_tokens: Maximum tokens in response. Note: o-series models use max_completion_tokens
+        batch: Submit through the provider's batch API (half price, slow). Only for
+            non-interactive work.
+        system: Instructions sent as the system prompt, ahead of the messages
+        tier: Pick the model by task class when model is not given: "fast" for
+            classification-style steps, "deep" for synthesis (see MODEL_TIERS)
+        cache: Serve temperature 0.0 requests from completion_cache. Pass False
+            when the call must reach the provider, e.g. a connectivity check
         
     Returns:
         The assistant's response text
         
     Raises:
-        ValueError: If provider is not supported or model is not available
+        ValueError: If provider is not supported, model is not available or tier is unknown
         
     Note:
         OpenAI o-series reasoning models (o1, o3, o4-mini) use the same Chat Completions API
         but have special behavior: they ignore temperature and may require max_completion_tokens
         instead of max_tokens. They also perform internal reasoning steps before responding.
+        
+        By default, completions at temperature 0.0 are served from completion_cache
+        when the identical request has been made before. Providers do not guarantee
+        identical output at temperature 0.0; the cache pins the first answer.
     """
-    if provider is None:
-        provider = get_default_provider()
+    provider, model = _resolve_provider_model(provider, model, tier)
     
-    if model is None:
-        model = get_default_model(provider)
+    cache_key = None
+    if cache and temperature == 0.0:
+        keyed_messages = messages if system is None else [{"role": "system", "content": system}, *messages]
+        cache_key = completion_cache.make_key(provider, model, temperature, max_tokens, keyed_messages)
+        cached = completion_cache.get(cache_key)
+        if cached is not None:
+            return cached
     
-    provider = provider.lower()
+    start = time.perf_counter()
+    response = _dispatch_chat_completion(messages, provider, model, temperature, max_tokens, batch, system)
     
-    # Validate provider
-    if provider not in ["openai", "anthropic"]:
-        raise ValueError(f"Unsupported provider: {provider}. Must be 'openai' or 'anthropic'")
-    
-    # Validate model for provider
-    if provider in AVAILABLE_MODELS and model not in AVAILABLE_MODELS[provider]:
-        available = ", ".join(AVAILABLE_MODELS[provider])
-        raise ValueError(f"Model '{model}' not available for {provider}. Available: {available}")
-    
-    # Route to appropriate client
-    if provider == "openai":
-        return openai_client.chat_completion(
-            messages=messages,
-            model=model,
-            temperature=temperature,
-            max_tokens=max_tokens
-        )
-    elif provider == "anthropic":
-        return anthropic_client.chat_completion(
-            messages=messages,
+    if cache_key is not None and response is not None:
+        completion_cache.put(cache_key, response, elapsed=time.perf_counter() - start)
+    return response
+
+def _dispatch_chat_completion(
+    messages: List[Dict[str, str]],
+    provider: str,
+    model: str,
+    temperature: float,
+    max_tokens: Optional[int],
+    batch: bool,
+    system: Optional[str] = None
+) -> str:
+    """Send a validated request to the provider client (or its batch API)."""
+    if batch:
+        responses = batch_chat_completion(
+            {"request": messages},
+            provider=provider,
             model=model,
             temperature=temperature,
-            max_tokens=max_tokens
+            max_tokens=max_tokens,
+            system=system
         )
+        if "request" not in responses:
+            raise RuntimeError(f"Batch request to {provider} model {model} did not succeed")
+        return responses["request"]
+    
+    # Route to appropriate client
+    return _provider_client(provider).chat_completion(
+        messages=messages,
+        model=model,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        system=system
+    )
+
+class JsonObjectEnd:
+    """
+    Stop condition for chat_completion_stream: true once the streamed text
+    contains one complete top-level JSON object.
+    
+    Only the text appended since the previous call is scanned, so checking
+    after every streamed token stays linear in the response length.
+    """
+    
+    def __init__(self):
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+    
+    def __call__(self, text: str) -> bool:
+        for i in range(self._pos, len(text)):
+            char = text[i]
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"' and self._depth:
+                self._in_string = True
+            elif char == "{":
+                self._depth += 1
+            elif char == "}" and self._depth:
+                self._depth -= 1
+                if not self._depth:
+                    self._pos = i + 1
+                    return True
+        self._pos = len(text)
+        return False
+
+def chat_completion_stream(
+    messages: List[Dict[str, str]],
+    provider: Optional[str] = None,
+    model: Optional[str] = None,
+    temperature: float = 0.0,
+    max_tokens: Optional[int] = None,
+    stop_when: Optional[Callable[[str], bool]] = None,
+    system: Optional[str] = None,
+    tier: Optional[str] = None
+) -> str:
+    """
+    Stream a completion and stop generating as soon as the useful part has arrived.
+    
+    For prompts whose answer is a single JSON object, tokens after the closing
+    brace are wasted generation time; the default stop condition closes the
+    stream at that point.
+    
+    Args:
+        messages, provider, model, temperature, max_tokens, system, tier: As for chat_completion
+        stop_when: Called with the text received so far after every streamed chunk;
+            streaming stops once it returns True. Defaults to a new JsonObjectEnd().
+        
+    Returns:
+        The response text received up to the point streaming stopped
+        
+    Raises:
+        ValueError: If provider is not supported, model is not available or tier is unknown
+    """
+    provider, model = _resolve_provider_model(provider, model, tier)
+    
+    if stop_when is None:
+        stop_when = JsonObjectEnd()
+    
+    return _provider_client(provider).chat_completion_stream(
+        messages=messages,
+        model=model,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        stop_when=stop_when,
+        system=system
+    )
+
+def batch_chat_completion(
+    batch: Dict[str, List[Dict[str, str]]],
+    provider: Optional[str] = None,
+    model: Optional[str] = None,
+    temperature: float = 0.0,
+    max_tokens: Optional[int] = None,
+    system: Optional[str] = None,
+    tier: Optional[str] = None
+) -> Dict[str, str]:
+    """
+    Send many independent conversations through the provider's batch API.
+    
+    Intended for bulk, non-interactive workloads: tokens are billed at half
+    price and the whole batch is one submission, but results can take from
+    minutes up to a day.
+    
+    Args:
+        batch: Dict mapping a caller-chosen custom_id to a list of message dicts
+        provider, model, temperature, max_tokens, system, tier: As for chat_completion
+        
+    Returns:
+        Dict mapping each custom_id to the assistant's response text.
+        Requests that failed or expired are omitted.
+        
+    Raises:
+        ValueError: If provider is not supported, model is not available or tier is unknown
+    """
+    provider, model = _resolve_provider_model(provider, model, tier)
+    
+    # Route to appropriate client
+    return _provider_client(provider).batch_chat_completion(
+        batch,
+        model=model,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        system=system
+    )
 
 def list_available_models(provider: Optional[str] = None) -> Dict[str, List[str]]:
     """
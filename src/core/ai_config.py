@@ -7,6 +7,7 @@ import argparse
 import os
 import sys
 from src.core.ai_client import chat_completion, list_available_models, get_current_config
+from src.core.env import OPENAI_API_KEY, ANTHROPIC_API_KEY
 
 def test_client(provider: str = None, model: str = None):
     """Test the AI client with a simple completion."""
@@ -19,7 +20,8 @@ def test_client(provider: str = None, model: str = None):
             messages=messages,
             provider=provider,
             model=model,
-            max_tokens=50
+            max_tokens=50,
+            cache=False
         )
         print(f"✅ Success: {response.strip()}")
         return True
@@ -40,8 +42,8 @@ def show_config():
     print(f"  AI_PROVIDER: {os.getenv('AI_PROVIDER', 'not set')}")
     print(f"  OPENAI_MODEL: {os.getenv('OPENAI_MODEL', 'not set')}")
     print(f"  ANTHROPIC_MODEL: {os.getenv('ANTHROPIC_MODEL', 'not set')}")
-    print(f"  OPENAI_API_KEY: {'set' if os.getenv('OPENAI_API_KEY') else 'not set'}")
-    print(f"  ANTHROPIC_API_KEY: {'set' if os.getenv('ANTHROPIC_API_KEY') else 'not set'}")
+    print(f"  OPENAI_API_KEY: {'set' if OPENAI_API_KEY else 'not set'}")
+    print(f"  ANTHROPIC_API_KEY: {'set' if ANTHROPIC_API_KEY else 'not set'}")
 
 def show_models():
     """Display available models for all providers."""
@@ -1,6 +1,8 @@
-import os
+import time
 import anthropic
 import httpx
+from src.core.env import ANTHROPIC_API_KEY
+from src.core.http_pool import http_client
 
 # Model-specific timeout configurations (in seconds)
 MODEL_TIMEOUTS = {
@@ -32,14 +34,35 @@ def get_timeout_for_model(model: str) -> int:
     # Default timeout for unknown models
     return 120
 
-# Create client with default timeout
+# Message Batches polling: first wait and cap (in seconds), doubling in between
+BATCH_POLL_INITIAL = 30
+BATCH_POLL_MAX = 600
+
+# The batch API requires max_tokens on every request
+BATCH_DEFAULT_MAX_TOKENS = 4096
+
+# Create client with default timeout, on the shared keep-alive connection pool
 default_timeout = httpx.Timeout(120.0)  # 2 minutes default
 client = anthropic.Anthropic(
-    api_key=os.getenv("ANTHROPIC_API_KEY"),
-    timeout=default_timeout
+    api_key=ANTHROPIC_API_KEY,
+    timeout=default_timeout,
+    http_client=http_client
 )
 
-def chat_completion(messages, model="claude-3-5-sonnet-20241022", temperature=0.0, max_tokens=None):
+def _message_params(messages, model, temperature, max_tokens, system=None):
+    """Build Messages API request parameters."""
+    params = {
+        "model": model,
+        "messages": messages,
+        "temperature": temperature,
+    }
+    if max_tokens is not None:
+        params["max_tokens"] = max_tokens
+    if system is not None:
+        params["system"] = system
+    return params
+
+def chat_completion(messages, model="claude-3-5-sonnet-20241022", temperature=0.0, max_tokens=None, system=None):
     """
     Send a sequence of chat messages to the Anthropic API and return the assistant's response text.
     Uses model-specific timeouts for better reliability with slower models.
@@ -48,25 +71,80 @@ def chat_completion(messages, model="claude-3-5-sonnet-20241022", temperature=0.
     timeout_seconds = get_timeout_for_model(model)
     model_timeout = httpx.Timeout(timeout_seconds)
     
-    # Create client with model-specific timeout
-    model_client = anthropic.Anthropic(
-        api_key=os.getenv("ANTHROPIC_API_KEY"),
-        timeout=model_timeout
-    )
-    
-    params = {
-        "model": model,
-        "messages": messages,
-        "temperature": temperature,
-    }
-    if max_tokens is not None:
-        params["max_tokens"] = max_tokens
+    params = _message_params(messages, model, temperature, max_tokens, system)
     
     try:
-        response = model_client.messages.create(**params)
+        response = client.messages.create(**params, timeout=model_timeout)
         return response.content[0].text
     except Exception as e:
         # Log timeout information for debugging
         if "timeout" in str(e).lower():
             print(f"⏱️  Timeout after {timeout_seconds}s for model {model}: {e}")
-        raise
\ No newline at end of file
+        raise
+
+def chat_completion_stream(messages, model="claude-3-5-sonnet-20241022", temperature=0.0, max_tokens=None,
+                           stop_when=None, system=None):
+    """
+    Stream a chat completion, returning the text received so far as soon as
+    stop_when(text) is true; the stream is closed so no further tokens are generated.
+    Returns the full response text if stop_when never fires.
+    """
+    timeout_seconds = get_timeout_for_model(model)
+    model_timeout = httpx.Timeout(timeout_seconds)
+    
+    params = _message_params(messages, model, temperature, max_tokens, system)
+    
+    text = ""
+    try:
+        with client.messages.stream(**params, timeout=model_timeout) as stream:
+            for delta in stream.text_stream:
+                text += delta
+                if stop_when is not None and stop_when(text):
+                    break
+        return text
+    except Exception as e:
+        # Log timeout information for debugging
+        if "timeout" in str(e).lower():
+            print(f"⏱️  Timeout after {timeout_seconds}s for model {model}: {e}")
+        raise
+
+def batch_chat_completion(batch, model="claude-3-5-sonnet-20241022", temperature=0.0, max_tokens=None, system=None):
+    """
+    Submit independent chat requests as one Message Batch and wait for the results.
+    
+    Batches are billed at half the token price and replace one HTTPS round-trip
+    per request with a single submission plus polling, at the cost of latency
+    (minutes to hours). Use only for work nobody is waiting on.
+    
+    Args:
+        batch: Dict mapping a caller-chosen custom_id to a list of chat messages
+        
+    Returns:
+        Dict mapping each custom_id to the assistant's response text. Requests
+        that did not succeed are left out.
+    """
+    requests = [
+        {
+            "custom_id": custom_id,
+            "params": _message_params(
+                messages, model, temperature, max_tokens or BATCH_DEFAULT_MAX_TOKENS, system
+            ),
+        }
+        for custom_id, messages in batch.items()
+    ]
+    message_batch = client.messages.batches.create(requests=requests)
+    
+    # Poll with exponential backoff until every request has been processed
+    delay = BATCH_POLL_INITIAL
+    while message_batch.processing_status != "ended":
+        time.sleep(delay)
+        delay = min(delay * 2, BATCH_POLL_MAX)
+        message_batch = client.messages.batches.retrieve(message_batch.id)
+    
+    responses = {}
+    for entry in client.messages.batches.results(message_batch.id):
+        if entry.result.type == "succeeded":
+            responses[entry.custom_id] = entry.result.message.content[0].text
+        else:
+            print(f"⚠️  Batch request {entry.custom_id} {entry.result.type} for model {model}")
+    return responses
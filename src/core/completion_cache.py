@@ -0,0 +1,157 @@
+"""
+Memoization of temperature 0.0 chat completions.
+
+Completions requested with temperature 0.0 are cached by a digest of
+(provider, model, temperature, max_tokens, messages): first in an in-memory
+LRU, then in a SQLite database that survives process restarts. A hit replaces
+a provider round-trip of hundreds of milliseconds with a dict lookup.
+
+Entries expire after SDD_COMPLETION_CACHE_TTL seconds and the database is
+pruned to MAX_DB_ENTRIES rows, so a changed prompt or a bad answer is not
+pinned forever. Set SDD_COMPLETION_CACHE=0 to disable caching entirely.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Set SDD_COMPLETION_CACHE=0 to always call the provider
+_enabled = os.getenv("SDD_COMPLETION_CACHE", "1") != "0"
+
+# Entries older than this are treated as misses and removed
+TTL_SECONDS = float(os.getenv("SDD_COMPLETION_CACHE_TTL", 7 * 24 * 3600))
+
+# In-memory LRU of key -> (value, stored at), least recently used entries first
+_memory_cache = OrderedDict()
+_memory_max_entries = 4096
+_memory_lock = threading.Lock()
+
+# Persistent tier, in a directory of its own so other caches' cleanup cannot remove it
+_db_path = Path(os.getenv("SDD_COMPLETION_CACHE_DIR", Path.home() / ".sdd" / "completions")) / "completions.sqlite3"
+_db = None
+_db_lock = threading.Lock()
+
+# Upper bound on rows kept on disk; the oldest are pruned first
+MAX_DB_ENTRIES = 10000
+
+# Prune expired and excess rows once per this many disk writes
+_PRUNE_EVERY = 100
+_writes_since_prune = 0
+
+# Completions faster than this are not worth a disk write
+MIN_CACHED_SECONDS = 0.05
+
+
+def make_key(provider: str, model: str, temperature: float, max_tokens: Optional[int],
+             messages: List[Dict[str, str]]) -> str:
+    """Create a deterministic cache key for a completion request."""
+    payload = json.dumps(
+        {"p": provider, "m": model, "t": temperature, "mt": max_tokens, "msgs": messages},
+        sort_keys=True
+    )
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+def get(key: str) -> Optional[str]:
+    """Return the cached completion for ``key``, checking memory then disk."""
+    if not _enabled:
+        return None
+
+    now = time.time()
+    with _memory_lock:
+        entry = _memory_cache.get(key)
+        if entry is not None:
+            if now - entry[1] < TTL_SECONDS:
+                _memory_cache.move_to_end(key)
+                return entry[0]
+            del _memory_cache[key]
+
+    # Fall back to the disk tier and promote hits into memory
+    with _db_lock:
+        db = _connect()
+        if db is None:
+            return None
+        try:
+            row = db.execute("SELECT value, ts FROM cache WHERE key = ?", (key,)).fetchone()
+        except sqlite3.Error:
+            return None
+
+    if row is None or now - row[1] >= TTL_SECONDS:
+        return None
+    _store_in_memory(key, row[0], row[1])
+    return row[0]
+
+
+def put(key: str, value: str, elapsed: float = None):
+    """Cache a completion; the disk write is skipped for completions that took under MIN_CACHED_SECONDS."""
+    global _writes_since_prune
+    if not _enabled:
+        return
+
+    now = time.time()
+    _store_in_memory(key, value, now)
+    if elapsed is not None and elapsed < MIN_CACHED_SECONDS:
+        return
+
+    with _db_lock:
+        db = _connect()
+        if db is None:
+            return
+        try:
+            with db:
+                db.execute(
+                    "INSERT OR REPLACE INTO cache (key, value, ts) VALUES (?, ?, ?)",
+                    (key, value, now)
+                )
+            _writes_since_prune += 1
+            if _writes_since_prune >= _PRUNE_EVERY:
+                _prune(db, now)
+        except sqlite3.Error:
+            # A failed write only costs a future cache miss
+            pass
+
+
+def _store_in_memory(key: str, value: str, stored_at: float):
+    """Store a completion in memory, evicting least recently used entries."""
+    with _memory_lock:
+        _memory_cache[key] = (value, stored_at)
+        _memory_cache.move_to_end(key)
+
+        while len(_memory_cache) > _memory_max_entries:
+            _memory_cache.popitem(last=False)
+
+
+def _prune(db: sqlite3.Connection, now: float):
+    """Delete expired rows and the oldest rows beyond MAX_DB_ENTRIES; called with _db_lock held."""
+    global _writes_since_prune
+    with db:
+        db.execute("DELETE FROM cache WHERE ts < ?", (now - TTL_SECONDS,))
+        db.execute(
+            "DELETE FROM cache WHERE key IN (SELECT key FROM cache ORDER BY ts DESC LIMIT -1 OFFSET ?)",
+            (MAX_DB_ENTRIES,)
+        )
+    _writes_since_prune = 0
+
+
+def _connect():
+    """Open the SQLite tier on first use; returns None when it is unavailable."""
+    global _db
+    if _db is None:
+        try:
+            _db_path.parent.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(str(_db_path), check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT, ts REAL)")
+            db.execute("CREATE INDEX IF NOT EXISTS cache_ts ON cache (ts)")
+            _prune(db, time.time())
+            _db = db
+        except (OSError, sqlite3.Error):
+            # Run memory-only rather than fail completions
+            _db = False
+    return _db or None
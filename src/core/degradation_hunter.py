@@ -1,53 +1,170 @@
-from time import sleep
+import asyncio
+import os
+import time
+import weakref
+
+from src.core.ai_client import chat_completion, get_default_provider
+
+# Seconds between analysis cycles
+ANALYSIS_INTERVAL = 3600  # Run hourly
+
+# Metric windows analyzed each cycle: result key -> get_metrics window
+METRIC_WINDOWS = {
+    "1_hour": "1h",
+    "1_day": "1d",
+    "1_week": "1w",
+    "1_month": "1mo"
+}
+
+# Fixed analysis instructions, sent as the system prompt; only the metrics
+# vary between calls
+WINDOW_ANALYSIS_RUBRIC = """
+Look for:
+1. Linear growth that will exhaust resources
+2. Exponential growth patterns
+3. Performance metrics degrading >1% per week
+4. Correlated degradations across services
+5. Unusual patterns compared to business growth
+
+For each pattern found:
+- Calculate rate of degradation
+- Project when constraints will be violated
+- Identify root cause hypotheses
+- Suggest early warning thresholds
+"""
+
+MERGE_ANALYSIS_RUBRIC = """
+Look for:
+1. Patterns confirmed across several time windows
+2. Correlated degradations across services
+3. Unusual patterns compared to business growth
+
+For each pattern found:
+- Calculate rate of degradation
+- Project when constraints will be violated
+- Identify root cause hypotheses
+- Suggest early warning thresholds
+"""
+
+# Requests per minute allowed per provider unless {PROVIDER}_RPM is set
+DEFAULT_RPM = 500
+
+class ProviderLimiter:
+    """Bound concurrent provider calls and pace them under a requests-per-minute cap"""
+
+    def __init__(self, rpm):
+        self._semaphore = asyncio.Semaphore(max(1, rpm // 60))
+        self._interval = 60 / rpm
+        self._next_start = 0.0
+
+    async def __aenter__(self):
+        await self._semaphore.acquire()
+
+        # Space request starts evenly so no one-minute window exceeds the cap
+        now = time.monotonic()
+        start = max(now, self._next_start)
+        self._next_start = start + self._interval
+        if start > now:
+            await asyncio.sleep(start - now)
+
+    async def __aexit__(self, *exc_info):
+        self._semaphore.release()
+
+# Limiters shared by every hunter, one per provider within each event loop; a
+# semaphore cannot be used from a loop other than the one it first ran on
+_limiters = weakref.WeakKeyDictionary()
+
+def provider_rpm(provider):
+    """Read the provider's {PROVIDER}_RPM cap, falling back to DEFAULT_RPM when unset or not positive"""
+    try:
+        rpm = int(os.getenv(f"{provider.upper()}_RPM", DEFAULT_RPM))
+    except ValueError:
+        return DEFAULT_RPM
+    return rpm if rpm > 0 else DEFAULT_RPM
+
+def provider_limiter(provider):
+    """Get the limiter shared by hunters on the running loop for a provider, sized from {PROVIDER}_RPM"""
+    loop_limiters = _limiters.setdefault(asyncio.get_running_loop(), {})
+    if provider not in loop_limiters:
+        loop_limiters[provider] = ProviderLimiter(provider_rpm(provider))
+    return loop_limiters[provider]
 
 class DegradationHunter:
     """Predictive monitoring of degradation patterns"""
 
-    def __init__(self, monitor_server):
+    def __init__(self, monitor_server, provider=None):
         self.monitor_server = monitor_server
+        self.provider = provider or get_default_provider()
+        self._stop = asyncio.Event()
+
+    async def continuous_analysis(self):
+        """Runs continuously, analyzing system trends, until stop() is called
+
+        Launch with asyncio.create_task(hunter.continuous_analysis()).
+        """
+        # Wake-ups are scheduled from a fixed monotonic reference, so the
+        # cadence does not drift by the time each cycle takes
+        next_run = time.monotonic()
+
+        while not self._stop.is_set():
+            await self._one_cycle()
 
-    def continuous_analysis(self):
-        """Runs continuously, analyzing system trends"""
+            # Pause before next iteration, waking early if stopped
+            next_run += ANALYSIS_INTERVAL
+            try:
+                await asyncio.wait_for(self._stop.wait(), max(0, next_run - time.monotonic()))
+            except asyncio.TimeoutError:
+                pass
 
-        while True:
-            # Collect metrics over multiple time windows
-            metrics = {
-                "1_hour": self.get_metrics(window="1h"),
-                "1_day": self.get_metrics(window="1d"),
-                "1_week": self.get_metrics(window="1w"),
-                "1_month": self.get_metrics(window="1mo")
-            }
+    def stop(self):
+        """Stop continuous_analysis after the current cycle"""
+        self._stop.set()
 
-            # AI analyzes for degradation patterns
-            analysis = self.analyze_degradation_patterns(metrics)
+    async def _one_cycle(self):
+        """Run one collect/analyze/predict/remediate pass"""
+        # Collect metrics over multiple time windows
+        metrics = {key: self.get_metrics(window=window) for key, window in METRIC_WINDOWS.items()}
 
-            # Predict future constraint violations
-            predictions = self.predict_constraint_violations(analysis)
+        # AI analyzes for degradation patterns
+        analysis = await self.analyze_degradation_patterns(metrics)
 
-            # Generate remediation plans if needed
-            if getattr(predictions, 'has_violations', False):
-                self.generate_remediation_plan(predictions)
+        # Predict future constraint violations
+        predictions = self.predict_constraint_violations(analysis)
 
-            # Pause before next iteration
-            sleep(3600)  # Run hourly
+        # Generate remediation plans if needed
+        if getattr(predictions, 'has_violations', False):
+            self.generate_remediation_plan(predictions)
 
-    def analyze_degradation_patterns(self, metrics):
+    async def analyze_degradation_patterns(self, metrics):
         """Analyze metrics for degradation patterns"""
-        prompt = f"""
-        Analyze these metrics for degradation patterns:
-        {metrics}
-
-        Look for:
-        1. Linear growth that will exhaust resources
-        2. Exponential growth patterns
-        3. Performance metrics degrading >1% per week
-        4. Correlated degradations across services
-        5. Unusual patterns compared to business growth
-
-        For each pattern found:
-        - Calculate rate of degradation
-        - Project when constraints will be violated
-        - Identify root cause hypotheses
-        - Suggest early warning thresholds
-        """
-        return self.ai_analyze(prompt)
\ No newline at end of file
+        # Each window is analyzed independently, so the calls run concurrently;
+        # spotting patterns in one window is classification work for a fast model
+        window_analyses = await asyncio.gather(*(
+            self.ai_analyze_async(
+                f"Analyze these {window} metrics for degradation patterns:\n{window_metrics}",
+                system=WINDOW_ANALYSIS_RUBRIC,
+                tier="fast"
+            )
+            for window, window_metrics in metrics.items()
+        ))
+
+        # Merge the per-window findings into one analysis with the deep model
+        findings = "\n\n".join(
+            f"{window}:\n{analysis}" for window, analysis in zip(metrics, window_analyses)
+        )
+        return await self.ai_analyze_async(
+            f"Combine these per-window degradation analyses into one report:\n{findings}",
+            system=MERGE_ANALYSIS_RUBRIC,
+            tier="deep"
+        )
+
+    def ai_analyze(self, prompt, system=None, tier=None):
+        """Send an analysis prompt to the configured AI provider"""
+        return chat_completion([{"role": "user", "content": prompt}], provider=self.provider,
+                               system=system, tier=tier)
+
+    async def ai_analyze_async(self, prompt, system=None, tier=None):
+        """Run ai_analyze in a worker thread so several analyses can be in flight at once,
+        within the provider's concurrency and requests-per-minute limits"""
+        async with provider_limiter(self.provider):
+            return await asyncio.to_thread(self.ai_analyze, prompt, system, tier)
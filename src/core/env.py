@@ -0,0 +1,14 @@
+"""
+Process-wide environment settings for the AI clients, read once at import.
+
+The environment is treated as fixed for the life of the process, so these are
+plain module constants rather than per-call os.getenv lookups.
+"""
+
+import os
+
+OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY")
+ANTHROPIC_API_KEY = os.environ.get("ANTHROPIC_API_KEY")
+
+# Set SDD_DYNAMIC_ENV=1 to have ai_client re-read provider/model defaults on every call
+DYNAMIC_ENV = os.environ.get("SDD_DYNAMIC_ENV") == "1"
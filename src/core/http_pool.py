@@ -0,0 +1,16 @@
+"""
+Shared HTTP connection pool for the AI provider clients.
+
+Both SDK clients send their requests through this one httpx client, so
+connections (and their TLS sessions) are kept alive and reused across
+calls instead of being set up again for every completion.
+"""
+
+import atexit
+import httpx
+
+http_client = httpx.Client(
+    limits=httpx.Limits(max_keepalive_connections=32, max_connections=64, keepalive_expiry=60.0),
+    timeout=httpx.Timeout(120.0)  # 2 minutes default; requests pass model-specific timeouts
+)
+atexit.register(http_client.close)
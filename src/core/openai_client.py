@@ -1,6 +1,10 @@
-import os
+import io
+import json
+import time
 from openai import OpenAI
 import httpx
+from src.core.env import OPENAI_API_KEY
+from src.core.http_pool import http_client
 
 # Model-specific timeout configurations (in seconds)
 MODEL_TIMEOUTS = {
@@ -36,27 +40,24 @@ def get_timeout_for_model(model: str) -> int:
     # Default timeout for unknown models
     return 120
 
-# Create client with default timeout
+# Seconds between Batch API status polls
+BATCH_POLL_INTERVAL = 60
+
+# Batch statuses after which no more results will arrive
+BATCH_FINAL_STATUSES = ("completed", "failed", "expired", "cancelled")
+
+# Create client with default timeout, on the shared keep-alive connection pool
 default_timeout = httpx.Timeout(120.0)  # 2 minutes default
 client = OpenAI(
-    api_key=os.getenv("OPENAI_API_KEY"),
-    timeout=default_timeout
+    api_key=OPENAI_API_KEY,
+    timeout=default_timeout,
+    http_client=http_client
 )
 
-def chat_completion(messages, model="gpt-4o", temperature=0.0, max_tokens=None):
-    """
-    Send a sequence of chat messages to the OpenAI API and return the assistant's response text.
-    Uses model-specific timeouts for better reliability with slower models.
-    """
-    # Get model-specific timeout
-    timeout_seconds = get_timeout_for_model(model)
-    model_timeout = httpx.Timeout(timeout_seconds)
-    
-    # Create client with model-specific timeout
-    model_client = OpenAI(
-        api_key=os.getenv("OPENAI_API_KEY"),
-        timeout=model_timeout
-    )
+def _completion_params(messages, model, temperature, max_tokens, system=None):
+    """Build Chat Completions request parameters, adjusted for the model's requirements."""
+    if system is not None:
+        messages = [{"role": "system", "content": system}, *messages]
     
     params = {
         "model": model,
@@ -78,8 +79,21 @@ def chat_completion(messages, model="gpt-4o", temperature=0.0, max_tokens=None):
         if max_tokens is not None:
             params["max_tokens"] = max_tokens
     
+    return params
+
+def chat_completion(messages, model="gpt-4o", temperature=0.0, max_tokens=None, system=None):
+    """
+    Send a sequence of chat messages to the OpenAI API and return the assistant's response text.
+    Uses model-specific timeouts for better reliability with slower models.
+    """
+    # Get model-specific timeout
+    timeout_seconds = get_timeout_for_model(model)
+    model_timeout = httpx.Timeout(timeout_seconds)
+    
+    params = _completion_params(messages, model, temperature, max_tokens, system)
+    
     try:
-        response = model_client.chat.completions.create(**params)
+        response = client.chat.completions.create(**params, timeout=model_timeout)
         return response.choices[0].message.content
     except Exception as e:
         # Enhanced error logging for debugging model-specific issues
@@ -91,3 +105,89 @@ def chat_completion(messages, model="gpt-4o", temperature=0.0, max_tokens=None):
         else:
             print(f"❌ Model {model} error: {e}")
         raise
+
+def chat_completion_stream(messages, model="gpt-4o", temperature=0.0, max_tokens=None, stop_when=None,
+                           system=None):
+    """
+    Stream a chat completion, returning the text received so far as soon as
+    stop_when(text) is true; the stream is closed so no further tokens are generated.
+    Returns the full response text if stop_when never fires.
+    """
+    timeout_seconds = get_timeout_for_model(model)
+    model_timeout = httpx.Timeout(timeout_seconds)
+    
+    params = _completion_params(messages, model, temperature, max_tokens, system)
+    
+    text = ""
+    try:
+        stream = client.chat.completions.create(**params, stream=True, timeout=model_timeout)
+        try:
+            for chunk in stream:
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if not delta:
+                    continue
+                text += delta
+                if stop_when is not None and stop_when(text):
+                    break
+        finally:
+            stream.close()
+        return text
+    except Exception as e:
+        if "timeout" in str(e).lower():
+            print(f"⏱️  Timeout after {timeout_seconds}s for model {model}: {e}")
+        else:
+            print(f"❌ Model {model} error: {e}")
+        raise
+
+def batch_chat_completion(batch, model="gpt-4o", temperature=0.0, max_tokens=None, system=None):
+    """
+    Submit independent chat requests through the Batch API and wait for the results.
+    
+    All requests are uploaded as one JSONL file and billed at half price, at the
+    cost of latency (up to the 24h completion window). Use only for work nobody
+    is waiting on.
+    
+    Args:
+        batch: Dict mapping a caller-chosen custom_id to a list of chat messages
+        
+    Returns:
+        Dict mapping each custom_id to the assistant's response text. Requests
+        that did not succeed are left out.
+    """
+    jsonl = "\n".join(
+        json.dumps({
+            "custom_id": custom_id,
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": _completion_params(messages, model, temperature, max_tokens, system),
+        })
+        for custom_id, messages in batch.items()
+    )
+    input_file = client.files.create(file=io.BytesIO(jsonl.encode()), purpose="batch")
+    openai_batch = client.batches.create(
+        input_file_id=input_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h"
+    )
+    
+    while openai_batch.status not in BATCH_FINAL_STATUSES:
+        time.sleep(BATCH_POLL_INTERVAL)
+        openai_batch = client.batches.retrieve(openai_batch.id)
+    
+    if openai_batch.status != "completed":
+        print(f"⚠️  Batch {openai_batch.id} {openai_batch.status} for model {model}")
+    
+    # Expired or cancelled batches still return the requests that finished
+    responses = {}
+    if openai_batch.output_file_id:
+        output = client.files.content(openai_batch.output_file_id).text
+        for line in output.splitlines():
+            if not line:
+                continue
+            entry = json.loads(line)
+            response = entry.get("response") or {}
+            if response.get("status_code") == 200:
+                responses[entry["custom_id"]] = response["body"]["choices"][0]["message"]["content"]
+            else:
+                print(f"⚠️  Batch request {entry['custom_id']} failed for model {model}: {entry.get('error')}")
+    return responses
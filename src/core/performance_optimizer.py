@@ -1,14 +1,47 @@
-import yaml
-from typing import Dict, Any, List
+import json
+import re
+from collections import deque
+from pathlib import Path
+from typing import Dict, Any, Iterator, List, Optional, Union
 from src.core.sdd_logger import get_logger
 
+# Test results kept in memory; older results are only in the history file
+_HISTORY_IN_MEMORY = 64
+
+# Performance constraint kinds, as bit flags
+LATENCY = 1
+THROUGHPUT = 2
+
+
+def _compile_constraints(constraints: Dict[str, Any]) -> List[tuple]:
+    """Parse performance constraints once into (kind, threshold) pairs."""
+    compiled = []
+    for constraint in constraints.get('performance', []):
+        requirement = constraint.get('requirement', '').lower()
+        
+        if 'latency' in requirement or 'response time' in requirement:
+            compiled.append((LATENCY, 100))  # 100ms threshold
+        elif 'throughput' in requirement:
+            compiled.append((THROUGHPUT, 500))  # 500 rps threshold
+    return compiled
+
+# Case-insensitive markers for optimizations already present in the code;
+# searching with these avoids building a lowercased copy of the source
+_POOL_RE = re.compile(r'pool', re.IGNORECASE)
+_CACHE_RE = re.compile(r'cache', re.IGNORECASE)
+
 
 class PerformanceOptimizer:
     """Iteratively improve implementation to meet performance constraints"""
 
-    def __init__(self, sdd_system=None):
+    def __init__(self, sdd_system=None, history_path: Optional[Union[str, Path]] = None):
         self.sdd = sdd_system
-        self.performance_history = []
+        # Bounded so long-running sessions do not grow without limit
+        self.performance_history = deque(maxlen=_HISTORY_IN_MEMORY)
+        # Optional append-only JSON Lines file holding every result
+        self.history_path = Path(history_path) if history_path else None
+        # (constraints, compiled) for the constraints last checked
+        self._compiled_constraints = (None, [])
         self.logger = get_logger("sdd.performance_optimizer")
 
     def optimize_for_constraints(self, implementation: Dict[str, Any], 
@@ -25,6 +58,9 @@ class PerformanceOptimizer:
                                'constraint_types': list(constraints.keys()) if constraints else []
                            })
 
+            # Parse the requirement strings once for the whole loop
+            self._get_compiled_constraints(constraints)
+
             optimization_result = {
                 'success': False,
                 'iterations': [],
@@ -34,6 +70,11 @@ class PerformanceOptimizer:
 
             current_implementation = implementation.copy()
             
+            # Generate performance tests; they depend only on the constraints,
+            # which do not change between iterations
+            with self.logger.timed_operation("generate_performance_tests"):
+                perf_tests = self.generate_performance_tests(constraints)
+            
             for iteration in range(max_iterations):
                 with self.logger.timed_operation(f"optimization_iteration_{iteration + 1}", 
                                                iteration=iteration + 1):
@@ -41,14 +82,10 @@ class PerformanceOptimizer:
                     self.logger.info(f"Performance optimization iteration {iteration + 1}/{max_iterations}",
                                    iteration=iteration + 1)
 
-                    # Generate performance tests
-                    with self.logger.timed_operation("generate_performance_tests"):
-                        perf_tests = self.generate_performance_tests(constraints)
-
                     # Run tests and measure
                     with self.logger.timed_operation("run_performance_tests"):
                         results = self.run_performance_tests(perf_tests, current_implementation)
-                        self.performance_history.append(results)
+                        self._record_history(results)
 
                     # Check if all constraints are met
                     constraints_satisfied = self.all_constraints_satisfied(results, constraints)
@@ -90,7 +127,7 @@ class PerformanceOptimizer:
                                    })
 
             optimization_result['final_implementation'] = current_implementation
-            optimization_result['optimization_history'] = self.performance_history
+            optimization_result['optimization_history'] = list(self.performance_history)
             
             self.logger.info(f"Performance optimization complete. Success: {optimization_result['success']}",
                            extra_data={
@@ -101,6 +138,26 @@ class PerformanceOptimizer:
             
             return optimization_result
 
+    def _record_history(self, results: Dict[str, Any]):
+        """Keep results in the in-memory window and append them to the history file."""
+        self.performance_history.append(results)
+        
+        if self.history_path is not None:
+            self.history_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.history_path, 'a', encoding='utf-8') as history_file:
+                history_file.write(json.dumps(results, default=str) + '\n')
+
+    def load_history(self) -> Iterator[Dict[str, Any]]:
+        """Iterate over every recorded result, oldest first, streaming from the history file."""
+        if self.history_path is None or not self.history_path.exists():
+            yield from self.performance_history
+            return
+        
+        with open(self.history_path, encoding='utf-8') as history_file:
+            for line in history_file:
+                if line.strip():
+                    yield json.loads(line)
+
     def generate_performance_tests(self, constraints: Dict[str, Any]) -> str:
         """Generate load tests based on constraints"""
         
@@ -152,20 +209,24 @@ def test_throughput():
     def all_constraints_satisfied(self, results: Dict[str, Any], constraints: Dict[str, Any]) -> bool:
         """Check if all performance constraints are satisfied"""
         
-        performance_constraints = constraints.get('performance', [])
-        
-        for constraint in performance_constraints:
-            requirement = constraint.get('requirement', '').lower()
-            
-            if 'latency' in requirement or 'response time' in requirement:
-                if results.get('response_time_p95', 999) > 100:  # 100ms threshold
+        for kind, threshold in self._get_compiled_constraints(constraints):
+            if kind & LATENCY:
+                if results.get('response_time_p95', 999) > threshold:
                     return False
-            elif 'throughput' in requirement:
-                if results.get('throughput_rps', 0) < 500:  # 500 rps threshold
+            elif kind & THROUGHPUT:
+                if results.get('throughput_rps', 0) < threshold:
                     return False
         
         return True
 
+    def _get_compiled_constraints(self, constraints: Dict[str, Any]) -> List[tuple]:
+        """Return compiled constraints, reusing them while the same constraints object is checked."""
+        cached_constraints, compiled = self._compiled_constraints
+        if cached_constraints is not constraints:
+            compiled = _compile_constraints(constraints)
+            self._compiled_constraints = (constraints, compiled)
+        return compiled
+
     def analyze_performance_gaps(self, results: Dict[str, Any], constraints: Dict[str, Any]) -> Dict[str, Any]:
         """AI analyzes why performance constraints aren't met"""
         
@@ -203,24 +264,24 @@ def test_throughput():
         
         # Mock optimization application for now
         # In a full implementation, this would use AI to modify the code
-        optimized_impl = implementation.copy()
-        
-        current_code = optimized_impl.get('main_module', '')
+        current_code = implementation.get('main_module', '')
         
         # Simple heuristic optimizations
-        if 'Add async/await' in str(optimizations):
+        optimizations_text = str(optimizations)
+        if 'Add async/await' in optimizations_text:
             if 'async def' not in current_code:
                 current_code = current_code.replace('def ', 'async def ', 1)
                 
-        if 'connection pooling' in str(optimizations):
-            if 'pool' not in current_code.lower():
+        if 'connection pooling' in optimizations_text:
+            if not _POOL_RE.search(current_code):
                 current_code = 'from sqlalchemy.pool import QueuePool\n' + current_code
                 
-        if 'caching' in str(optimizations):
-            if 'cache' not in current_code.lower():
+        if 'caching' in optimizations_text:
+            if not _CACHE_RE.search(current_code):
                 current_code = 'from functools import lru_cache\n' + current_code
         
-        optimized_impl['main_module'] = current_code
+        # Only main_module changes; build the result in one step
+        optimized_impl = {**implementation, 'main_module': current_code}
         
         self.logger.info("Applied performance optimizations",
                         extra_data={'optimizations_applied': optimizations})
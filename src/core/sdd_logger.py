@@ -5,46 +5,104 @@ This module provides structured logging with correlation IDs to trace generation
 through their entire lifecycle from specification to output code.
 """
 
+import atexit
+import contextvars
+import copy
 import json
 import logging
+import logging.handlers
+import os
+import queue
+import threading
 import time
-import uuid
 from contextlib import contextmanager
-from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, Optional, Union
-from threading import local
 
-# Thread-local storage for correlation context
-_context = local()
+# Prefer orjson's faster encoder for log entries when it is installed
+# (bound once here to skip the attribute lookup per record). Naive datetimes
+# in log data are treated as UTC and written with a 'Z' suffix, matching the
+# entry timestamp.
+try:
+    import orjson
+    _orjson_dumps = orjson.dumps
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z | orjson.OPT_NAIVE_UTC
+except ImportError:
+    _orjson_dumps = None
 
+# Bound once; correlation and request IDs only need 128 random bits
+_urandom = os.urandom
 
-class CorrelationFilter(logging.Filter):
-    """Logging filter that adds correlation ID and context to log records."""
-    
-    def filter(self, record):
-        # Add correlation ID
-        record.correlation_id = getattr(_context, 'correlation_id', 'no-correlation')
-        
-        # Add context information
-        record.component = getattr(_context, 'component', 'unknown')
-        record.operation = getattr(_context, 'operation', 'unknown')
-        record.request_id = getattr(_context, 'request_id', 'no-request')
-        
-        return True
+
+def _new_id() -> str:
+    """Generate a random correlation or request ID as 32 hex characters."""
+    return _urandom(16).hex()
+
+
+# Log files are written through a buffer of this many bytes
+LOG_FILE_BUFFER_SIZE = 64 * 1024
+
+# Records held in memory before being handed to the file handler
+LOG_FILE_BUFFER_RECORDS = 512
+
+
+def _dumps(log_entry: Dict[str, Any]) -> str:
+    """Serialize a log entry to JSON, with orjson when available."""
+    if _orjson_dumps is not None:
+        try:
+            return _orjson_dumps(log_entry, default=str, option=_ORJSON_OPTIONS).decode()
+        except TypeError:  # orjson.JSONEncodeError, e.g. integers wider than 64 bits
+            pass
+    return json.dumps(log_entry, default=str)
+
+
+def _json_prefix(component: Optional[str], correlation_id: Optional[str],
+                 request_id: Optional[str], operation: Optional[str]) -> str:
+    """Serialize the correlation fields as the opening of a JSON object, up to a trailing comma."""
+    return _dumps({
+        'component': component,
+        'correlation_id': correlation_id,
+        'request_id': request_id,
+        'operation': operation,
+    })[:-1] + ','
+
+
+# Prefix for records logged outside any correlation context
+_DEFAULT_JSON_PREFIX = _json_prefix('unknown', 'no-correlation', 'no-request', 'unknown')
+
+# Correlation context, held in serialized form; context variables follow
+# asyncio tasks as well as threads
+_json_prefix_var = contextvars.ContextVar('json_prefix', default=_DEFAULT_JSON_PREFIX)
 
 
 class SDDJSONFormatter(logging.Formatter):
     """JSON formatter for structured logging."""
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # (second, formatted date and time up to that second), reused for
+        # records within the same second; one tuple so threads never see a mix
+        self._last_second = (None, '')
+    
+    def _timestamp(self, record) -> str:
+        """ISO 8601 UTC timestamp with millisecond precision for a record."""
+        sec = int(record.created)
+        last_sec, prefix = self._last_second
+        if sec != last_sec:
+            prefix = "%04d-%02d-%02dT%02d:%02d:%02d" % time.gmtime(sec)[:6]
+            self._last_second = (sec, prefix)
+        return "%s.%03dZ" % (prefix, record.msecs)
+    
     def format(self, record):
+        # The correlation fields only change between contexts, so they are
+        # pre-serialized and only the per-record fields are encoded here.
+        # Queued records carry the prefix of the context they were logged in;
+        # otherwise this is the logging thread and the context is current.
+        prefix = record.__dict__.get('json_prefix') or _json_prefix_var.get()
+        
         log_entry = {
-            'timestamp': datetime.utcfromtimestamp(record.created).isoformat() + 'Z',
+            'timestamp': self._timestamp(record),
             'level': record.levelname,
-            'component': getattr(record, 'component', 'unknown'),
-            'operation': getattr(record, 'operation', 'unknown'),
-            'correlation_id': getattr(record, 'correlation_id', 'no-correlation'),
-            'request_id': getattr(record, 'request_id', 'no-request'),
             'message': record.getMessage(),
         }
         
@@ -64,7 +122,76 @@ class SDDJSONFormatter(logging.Formatter):
         if record.exc_info:
             log_entry['exception'] = self.formatException(record.exc_info)
             
-        return json.dumps(log_entry, default=str)
+        return prefix + _dumps(log_entry)[1:]
+
+
+class BufferedFileHandler(logging.StreamHandler):
+    """Append records to a log file through a large write buffer.
+    
+    Unlike FileHandler, records are not flushed one at a time: the buffer is
+    written out when full, and flushed and fsynced as soon as an ERROR or
+    higher record arrives so failures reach the disk.
+    """
+    
+    def __init__(self, filename: Path, buffer_size: int = LOG_FILE_BUFFER_SIZE):
+        super().__init__(open(filename, 'a', buffering=buffer_size, encoding='utf-8'))
+    
+    def emit(self, record):
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.ERROR:
+                self.flush()
+                os.fsync(self.stream.fileno())
+        except Exception:
+            self.handleError(record)
+    
+    def close(self):
+        self.acquire()
+        try:
+            if self.stream:
+                try:
+                    self.flush()
+                finally:
+                    self.stream.close()
+                    self.stream = None
+        finally:
+            self.release()
+            super().close()
+
+
+class SDDQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that captures the correlation context for SDDJSONFormatter.
+    
+    Records are formatted on the listener thread, where the caller's context
+    variables are not visible, so the serialized context travels on the record.
+    """
+    
+    def prepare(self, record):
+        # Merge the arguments now, as they may change before the listener runs;
+        # unlike the base class, leave exc_info for the formatter's 'exception' field
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        record.json_prefix = _json_prefix_var.get()
+        return record
+
+
+def _close_handlers(logger: logging.Logger):
+    """Drain and close the handlers of a logger; safe to call more than once."""
+    for handler in logger.handlers:
+        listener = getattr(handler, 'listener', None)
+        if listener is not None:
+            listener.stop()
+            handler.listener = None
+            for target in listener.handlers:
+                # MemoryHandler.close() flushes into its target and then drops
+                # the reference, so keep it to close the file underneath
+                buffered_target = getattr(target, 'target', None)
+                target.close()
+                if buffered_target is not None:
+                    buffered_target.close()
+        handler.close()
+    logger.handlers = []
 
 
 class SDDLogger:
@@ -73,26 +200,39 @@ class SDDLogger:
     def __init__(self, name: str, log_level: str = "INFO", log_file: Optional[Path] = None):
         self.logger = logging.getLogger(name)
         self.logger.setLevel(getattr(logging, log_level.upper()))
+        # Bound once to skip the self -> logger -> method lookups per call
+        self._is_enabled = self.logger.isEnabledFor
+        self._emit = self.logger.log
         
-        # Clear any existing handlers
-        self.logger.handlers = []
+        # Close and clear any existing handlers
+        _close_handlers(self.logger)
         
-        # Add correlation filter
-        correlation_filter = CorrelationFilter()
+        # One formatter for every handler, so its per-second timestamp cache is shared
+        formatter = SDDJSONFormatter()
         
         # Console handler with JSON formatting
         console_handler = logging.StreamHandler()
-        console_handler.setFormatter(SDDJSONFormatter())
-        console_handler.addFilter(correlation_filter)
-        self.logger.addHandler(console_handler)
+        console_handler.setFormatter(formatter)
+        handlers = [console_handler]
         
-        # File handler if specified
+        # File handler if specified; records are batched in memory and written
+        # through a buffered stream, with ERROR records flushing immediately
         if log_file:
             log_file.parent.mkdir(parents=True, exist_ok=True)
-            file_handler = logging.FileHandler(log_file)
-            file_handler.setFormatter(SDDJSONFormatter())
-            file_handler.addFilter(correlation_filter)
-            self.logger.addHandler(file_handler)
+            file_handler = BufferedFileHandler(log_file)
+            file_handler.setFormatter(formatter)
+            handlers.append(logging.handlers.MemoryHandler(
+                LOG_FILE_BUFFER_RECORDS, flushLevel=logging.ERROR, target=file_handler
+            ))
+        
+        # Logging threads only enqueue records; a background listener formats
+        # and writes them, so callers never wait on handler locks or I/O
+        log_queue = queue.SimpleQueue()
+        queue_handler = SDDQueueHandler(log_queue)
+        queue_handler.listener = logging.handlers.QueueListener(log_queue, *handlers)
+        queue_handler.listener.start()
+        self.logger.addHandler(queue_handler)
+        atexit.register(_close_handlers, self.logger)
     
     @contextmanager
     def correlation_context(self, correlation_id: Optional[str] = None, 
@@ -100,23 +240,14 @@ class SDDLogger:
                            operation: str = "unknown",
                            request_id: Optional[str] = None):
         """Context manager for correlation tracking."""
-        old_correlation_id = getattr(_context, 'correlation_id', None)
-        old_component = getattr(_context, 'component', None)
-        old_operation = getattr(_context, 'operation', None)
-        old_request_id = getattr(_context, 'request_id', None)
-        
-        _context.correlation_id = correlation_id or str(uuid.uuid4())
-        _context.component = component
-        _context.operation = operation
-        _context.request_id = request_id or str(uuid.uuid4())
+        correlation_id = correlation_id or _new_id()
+        request_id = request_id or _new_id()
+        token = _json_prefix_var.set(_json_prefix(component, correlation_id, request_id, operation))
         
         try:
-            yield _context.correlation_id
+            yield correlation_id
         finally:
-            _context.correlation_id = old_correlation_id
-            _context.component = old_component
-            _context.operation = old_operation
-            _context.request_id = old_request_id
+            _json_prefix_var.reset(token)
     
     @contextmanager
     def timed_operation(self, operation_name: str, **extra_data):
@@ -140,7 +271,9 @@ class SDDLogger:
     
     def debug(self, message: str, **kwargs):
         """Log debug message with optional extra data."""
-        self._log(logging.DEBUG, message, **kwargs)
+        # Debug is usually disabled, so skip forwarding the kwargs
+        if self._is_enabled(logging.DEBUG):
+            self._log(logging.DEBUG, message, **kwargs)
     
     def info(self, message: str, **kwargs):
         """Log info message with optional extra data."""
@@ -156,6 +289,10 @@ class SDDLogger:
     
     def _log(self, level: int, message: str, **kwargs):
         """Internal logging method that handles extra data."""
+        # Skip building the extra fields for records below the logger's level
+        if not self._is_enabled(level):
+            return
+        
         extra = {}
         
         # Extract special logging fields
@@ -172,11 +309,15 @@ class SDDLogger:
         if kwargs:
             extra['extra_data'] = {**(extra.get('extra_data', {})), **kwargs}
         
-        self.logger.log(level, message, extra=extra)
+        self._emit(level, message, extra=extra)
     
     def log_mcp_call(self, server_name: str, tool_name: str, arguments: Dict[str, Any], 
                      result: Optional[Dict[str, Any]] = None, error: Optional[str] = None):
         """Log MCP server tool calls."""
+        # Only failures are logged above DEBUG; skip building call_data for the rest
+        if (result or not error) and not self._is_enabled(logging.DEBUG):
+            return
+        
         call_data = {
             'server': server_name,
             'tool': tool_name,
@@ -246,48 +387,58 @@ class SDDLogger:
                         success_rate: float):
         """Log test execution results."""
         level = logging.INFO if success_rate >= 0.8 else logging.WARNING
-        self.logger.log(level, f"Test results for {test_type}: {passed}/{passed+failed} passed",
-                       extra={
-                           'extra_data': {
-                               'test_type': test_type,
-                               'passed': passed,
-                               'failed': failed,
-                               'success_rate': success_rate
-                           }
-                       })
+        self._emit(level, f"Test results for {test_type}: {passed}/{passed+failed} passed",
+                   extra={
+                       'extra_data': {
+                           'test_type': test_type,
+                           'passed': passed,
+                           'failed': failed,
+                           'success_rate': success_rate
+                       }
+                   })
     
     def log_constraint_verification(self, constraint_type: str, status: str, 
                                    details: Dict[str, Any]):
         """Log constraint verification results."""
         level = logging.INFO if status == 'passed' else logging.WARNING
-        self.logger.log(level, f"Constraint verification: {constraint_type} {status}",
-                       extra={
-                           'extra_data': {
-                               'constraint_type': constraint_type,
-                               'verification_status': status,
-                               'details': details
-                           }
-                       })
+        self._emit(level, f"Constraint verification: {constraint_type} {status}",
+                   extra={
+                       'extra_data': {
+                           'constraint_type': constraint_type,
+                           'verification_status': status,
+                           'details': details
+                       }
+                   })
 
 
 # Global logger instances
 _loggers: Dict[str, SDDLogger] = {}
 
+# Serializes logger creation; lookups of existing loggers do not take it
+_loggers_lock = threading.Lock()
+
 
 def get_logger(name: str, log_level: str = "INFO", 
                log_file: Optional[Union[str, Path]] = None) -> SDDLogger:
     """Get or create a logger instance."""
-    if name not in _loggers:
-        log_file_path = Path(log_file) if log_file else None
-        _loggers[name] = SDDLogger(name, log_level, log_file_path)
-    return _loggers[name]
+    logger = _loggers.get(name)
+    if logger is None:
+        # Creating an SDDLogger replaces the handlers of the underlying logger,
+        # so two threads must not both create one for the same name
+        with _loggers_lock:
+            logger = _loggers.get(name)
+            if logger is None:
+                log_file_path = Path(log_file) if log_file else None
+                logger = _loggers[name] = SDDLogger(name, log_level, log_file_path)
+    return logger
 
 
 def configure_logging(log_level: str = "INFO", 
                      log_file: Optional[Union[str, Path]] = None):
     """Configure global logging settings."""
     # Clear existing loggers
-    _loggers.clear()
+    with _loggers_lock:
+        _loggers.clear()
     
     # Set up root logger
     root_logger = get_logger("sdd", log_level, log_file)
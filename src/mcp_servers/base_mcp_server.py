@@ -9,7 +9,7 @@ import asyncio
 import json
 import logging
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional, Callable
+from typing import Dict, List, Any, Optional, Callable, Union
 from dataclasses import dataclass
 from pathlib import Path
 from src.core.sdd_logger import get_logger
@@ -147,12 +147,17 @@ class BaseMCPServer(ABC):
         self.prompts[name] = prompt
         self.logger.info(f"Registered prompt: {name}")
 
-    async def handle_mcp_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+    async def handle_mcp_request(self, request: Union[Dict[str, Any], List[Dict[str, Any]]]) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
         """
         Handle an MCP protocol request.
         
-        This is the main entry point for MCP protocol messages.
+        This is the main entry point for MCP protocol messages. A list of
+        requests is treated as a JSON-RPC batch and answered with a list of
+        responses in the same order.
         """
+        if isinstance(request, list):
+            return await self._handle_batch(request)
+        
         try:
             method = request.get("method")
             params = request.get("params", {})
@@ -179,6 +184,13 @@ class BaseMCPServer(ABC):
             self.logger.error(f"Error handling MCP request: {e}")
             return self._error_response(request.get("id"), "INTERNAL_ERROR", str(e))
 
+    async def _handle_batch(self, requests: List[Dict[str, Any]]) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        """Handle a JSON-RPC batch by dispatching its requests concurrently."""
+        if not requests:
+            return self._error_response(None, "INVALID_REQUEST", "Empty batch request")
+        
+        return list(await asyncio.gather(*(self.handle_mcp_request(request) for request in requests)))
+
     async def _handle_initialize(self, params: Dict[str, Any], request_id: Any) -> Dict[str, Any]:
         """Handle MCP initialize request."""
         return {
@@ -218,9 +230,15 @@ class BaseMCPServer(ABC):
 
     async def _handle_tools_call(self, params: Dict[str, Any], request_id: Any) -> Dict[str, Any]:
         """Handle tools/call request."""
-        tool_name = params.get("name")
-        arguments = params.get("arguments", {})
+        return await self.call_tool(params.get("name"), params.get("arguments", {}), request_id)
 
+    async def call_tool(self, tool_name: str, arguments: Dict[str, Any], request_id: Any = None) -> Dict[str, Any]:
+        """
+        Run a registered tool and return its tools/call response.
+        
+        This is the single place tool calls are logged, timed and serialized;
+        in-process callers use it directly instead of building a JSON-RPC request.
+        """
         with self.logger.correlation_context(component=f"mcp.{self.name}", 
                                            operation=f"tool_call.{tool_name}",
                                            request_id=str(request_id)):
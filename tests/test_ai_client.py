@@ -0,0 +1,58 @@
+"""
+Tests for the provider-independent parts of the AI client.
+"""
+
+from pathlib import Path
+import sys
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core.ai_client import JsonObjectEnd
+
+
+def feed(text, chunk_size=1):
+    """Stream text into a new JsonObjectEnd; return the received text at the stop, or None."""
+    stop_when = JsonObjectEnd()
+    received = ""
+    for i in range(0, len(text), chunk_size):
+        received += text[i:i + chunk_size]
+        if stop_when(received):
+            return received
+    return None
+
+
+def test_stops_after_flat_object():
+    assert feed('{"a": 1} trailing text') == '{"a": 1}'
+
+
+def test_stops_after_outermost_of_nested_objects():
+    text = '{"a": {"b": {"c": []}}, "d": {}}'
+    assert feed(text + "\nmore") == text
+
+
+def test_ignores_braces_inside_strings():
+    text = '{"code": "def f(): return {\'x\': 1}}", "n": "}"}'
+    assert feed(text + " extra") == text
+
+
+def test_handles_escaped_quotes_and_backslashes():
+    text = r'{"a": "say \"}\" now", "b": "C:\\", "c": "{"}'
+    assert feed(text + "!") == text
+
+
+def test_skips_prose_before_object():
+    assert feed('Here is the result:\n{"ok": true}\nThanks') == 'Here is the result:\n{"ok": true}'
+
+
+def test_incomplete_object_does_not_stop():
+    assert feed('{"a": {"b": "}"') is None
+
+
+def test_result_is_independent_of_chunking():
+    text = '{"a": "x}y", "b": {"c": "\\"{"}}'
+    for chunk_size in (1, 2, 3, 7, len(text)):
+        received = feed(text + " tail", chunk_size)
+        # Streaming stops with the chunk that holds the closing brace
+        assert received.startswith(text)
+        assert len(received) < len(text) + chunk_size
@@ -0,0 +1,96 @@
+"""
+Tests for BaseMCPServer request handling.
+"""
+
+import asyncio
+import json
+from pathlib import Path
+import sys
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.mcp_servers.base_mcp_server import BaseMCPServer
+
+
+class EchoServer(BaseMCPServer):
+    """Minimal server with one tool that echoes its arguments."""
+    
+    def __init__(self):
+        super().__init__("echo-test")
+    
+    def _register_capabilities(self):
+        self.register_tool("echo", "Echo the arguments", {"type": "object"}, self._echo)
+        self.register_tool("fail", "Always fails", {"type": "object"}, self._fail)
+    
+    async def _echo(self, **arguments):
+        return arguments
+    
+    async def _fail(self):
+        raise RuntimeError("boom")
+    
+    async def _read_resource(self, uri):
+        return ""
+    
+    async def _get_prompt(self, name, arguments):
+        return ""
+
+
+def tool_call(request_id, name, arguments=None):
+    return {
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "method": "tools/call",
+        "params": {"name": name, "arguments": arguments or {}}
+    }
+
+
+def test_batch_responses_keep_request_order():
+    server = EchoServer()
+    
+    responses = asyncio.run(server.handle_mcp_request([
+        tool_call(1, "echo", {"n": 1}),
+        {"jsonrpc": "2.0", "id": 2, "method": "tools/list"},
+        tool_call(3, "echo", {"n": 3}),
+    ]))
+    
+    assert [response["id"] for response in responses] == [1, 2, 3]
+    assert json.loads(responses[0]["result"]["content"][0]["text"]) == {"n": 1}
+    assert {tool["name"] for tool in responses[1]["result"]["tools"]} == {"echo", "fail"}
+    assert json.loads(responses[2]["result"]["content"][0]["text"]) == {"n": 3}
+
+
+def test_batch_reports_errors_per_request():
+    server = EchoServer()
+    
+    responses = asyncio.run(server.handle_mcp_request([
+        tool_call(1, "fail"),
+        {"jsonrpc": "2.0", "id": 2, "method": "no/such/method"},
+        tool_call(3, "echo"),
+    ]))
+    
+    assert responses[0]["error"]["code"] == "TOOL_ERROR"
+    assert responses[1]["error"]["code"] == "METHOD_NOT_FOUND"
+    assert "result" in responses[2]
+
+
+def test_empty_batch_is_an_invalid_request():
+    response = asyncio.run(EchoServer().handle_mcp_request([]))
+    
+    assert response["id"] is None
+    assert response["error"]["code"] == "INVALID_REQUEST"
+
+
+def test_call_tool_matches_tools_call_response():
+    server = EchoServer()
+    
+    direct = asyncio.run(server.call_tool("echo", {"n": 1}, 7))
+    via_request = asyncio.run(server.handle_mcp_request(tool_call(7, "echo", {"n": 1})))
+    
+    assert direct == via_request
+
+
+def test_call_tool_unknown_tool():
+    response = asyncio.run(EchoServer().call_tool("missing", {}, 1))
+    
+    assert response["error"]["code"] == "TOOL_NOT_FOUND"
@@ -0,0 +1,111 @@
+"""
+Tests for the completion cache.
+"""
+
+from collections import OrderedDict
+from pathlib import Path
+import sys
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core import completion_cache
+
+
+MESSAGES = [{"role": "user", "content": "Summarize the spec"}]
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    """The completion cache module, with a fresh memory tier and a database under tmp_path."""
+    monkeypatch.setattr(completion_cache, "_enabled", True)
+    monkeypatch.setattr(completion_cache, "_memory_cache", OrderedDict())
+    monkeypatch.setattr(completion_cache, "_db_path", tmp_path / "completions.sqlite3")
+    monkeypatch.setattr(completion_cache, "_db", None)
+    yield completion_cache
+    if completion_cache._db:
+        completion_cache._db.close()
+
+
+def test_key_is_stable_and_order_insensitive():
+    key = completion_cache.make_key("openai", "gpt-4o", 0.0, None, MESSAGES)
+    
+    assert key == completion_cache.make_key("openai", "gpt-4o", 0.0, None, [dict(reversed(MESSAGES[0].items()))])
+    assert len(key) == 32
+
+
+def test_key_changes_with_any_request_field():
+    key = completion_cache.make_key("openai", "gpt-4o", 0.0, None, MESSAGES)
+    
+    assert key != completion_cache.make_key("anthropic", "gpt-4o", 0.0, None, MESSAGES)
+    assert key != completion_cache.make_key("openai", "gpt-4o-mini", 0.0, None, MESSAGES)
+    assert key != completion_cache.make_key("openai", "gpt-4o", 0.0, 100, MESSAGES)
+    assert key != completion_cache.make_key("openai", "gpt-4o", 0.0, None, [{"role": "user", "content": "Other"}])
+
+
+def test_put_then_get_survives_memory_loss(cache):
+    cache.put("k", "answer")
+    cache._memory_cache.clear()
+    
+    assert cache.get("k") == "answer"
+    assert "k" in cache._memory_cache
+
+
+def test_fast_completions_are_not_written_to_disk(cache):
+    cache.put("k", "answer", elapsed=cache.MIN_CACHED_SECONDS / 2)
+    cache._memory_cache.clear()
+    
+    assert cache.get("k") is None
+
+
+def test_memory_tier_evicts_least_recently_used(cache, monkeypatch):
+    monkeypatch.setattr(cache, "_memory_max_entries", 2)
+    monkeypatch.setattr(cache, "_connect", lambda: None)
+    
+    cache.put("a", "1")
+    cache.put("b", "2")
+    cache.get("a")
+    cache.put("c", "3")
+    
+    assert list(cache._memory_cache) == ["a", "c"]
+    assert cache.get("b") is None
+
+
+def test_expired_entries_are_misses(cache, monkeypatch):
+    cache.put("k", "answer")
+    monkeypatch.setattr(cache, "TTL_SECONDS", 0)
+    
+    assert cache.get("k") is None
+
+
+def test_disk_tier_is_pruned_to_max_entries(cache, monkeypatch):
+    monkeypatch.setattr(cache, "MAX_DB_ENTRIES", 3)
+    monkeypatch.setattr(cache, "_PRUNE_EVERY", 1)
+    
+    for i in range(6):
+        cache.put(str(i), "answer")
+    
+    assert cache._db.execute("SELECT COUNT(*) FROM cache").fetchone()[0] == 3
+
+
+def test_falls_back_to_memory_only_when_database_unavailable(cache, tmp_path, monkeypatch):
+    blocker = tmp_path / "not-a-directory"
+    blocker.write_text("")
+    monkeypatch.setattr(cache, "_db_path", blocker / "completions.sqlite3")
+    
+    cache.put("k", "answer")
+    
+    assert cache._db is False
+    assert cache.get("k") == "answer"
+    assert cache.get("missing") is None
+
+
+def test_disabled_cache_stores_nothing(cache, monkeypatch):
+    monkeypatch.setattr(cache, "_enabled", False)
+    
+    cache.put("k", "answer")
+    
+    assert cache.get("k") is None
+    assert not cache._memory_cache
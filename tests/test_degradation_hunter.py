@@ -0,0 +1,38 @@
+"""
+Tests for the per-provider rate limiting of degradation analyses.
+"""
+
+import asyncio
+from pathlib import Path
+import sys
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core import degradation_hunter
+from src.core.degradation_hunter import DEFAULT_RPM, DegradationHunter, provider_rpm
+
+
+def test_rpm_falls_back_to_default_when_not_positive_or_invalid(monkeypatch):
+    for value in ("0", "-5", "fast"):
+        monkeypatch.setenv("TESTPROVIDER_RPM", value)
+        assert provider_rpm("testprovider") == DEFAULT_RPM
+
+    monkeypatch.setenv("TESTPROVIDER_RPM", "120")
+    assert provider_rpm("testprovider") == 120
+
+
+def test_hunter_analyzes_across_event_loops(monkeypatch):
+    monkeypatch.setenv("TESTPROVIDER_RPM", "6000")
+    hunter = DegradationHunter(monitor_server=None, provider="testprovider")
+    monkeypatch.setattr(hunter, "ai_analyze", lambda prompt, system=None, tier=None: prompt.upper())
+
+    async def analyze():
+        results = await asyncio.gather(*(hunter.ai_analyze_async(f"p{i}") for i in range(3)))
+        return results, degradation_hunter.provider_limiter("testprovider")
+
+    # Each asyncio.run gets its own loop; the limiter must not carry over
+    first, first_limiter = asyncio.run(analyze())
+    second, second_limiter = asyncio.run(analyze())
+    assert first == second == ["P0", "P1", "P2"]
+    assert first_limiter is not second_limiter
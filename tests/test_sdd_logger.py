@@ -0,0 +1,109 @@
+"""
+Tests for structured logging and correlation tracking.
+"""
+
+import asyncio
+import json
+import logging.handlers
+from pathlib import Path
+import sys
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core.sdd_logger import SDDLogger, _close_handlers
+
+
+def read_entries(logger, log_file):
+    """Drain the logger's queue listener and return the JSON entries written to log_file."""
+    _close_handlers(logger.logger)
+    return [json.loads(line) for line in log_file.read_text().splitlines()]
+
+
+def test_queued_records_keep_context_of_their_asyncio_task(tmp_path):
+    log_file = tmp_path / "sdd.log"
+    logger = SDDLogger("sdd.test.tasks", log_file=log_file)
+    
+    async def task(n, delay):
+        with logger.correlation_context(f"corr-{n}", component=f"component-{n}", request_id=f"req-{n}"):
+            logger.info(f"before {n}")
+            await asyncio.sleep(delay)
+            logger.info(f"after {n}")
+    
+    async def main():
+        # Interleave the two tasks' records on the same thread
+        await asyncio.gather(task(1, 0.02), task(2, 0.01))
+    
+    asyncio.run(main())
+    entries = read_entries(logger, log_file)
+    
+    assert len(entries) == 4
+    for entry in entries:
+        n = entry["message"].split()[-1]
+        assert entry["correlation_id"] == f"corr-{n}"
+        assert entry["component"] == f"component-{n}"
+        assert entry["request_id"] == f"req-{n}"
+
+
+def test_context_is_restored_after_exit(tmp_path):
+    log_file = tmp_path / "sdd.log"
+    logger = SDDLogger("sdd.test.restore", log_file=log_file)
+    
+    with logger.correlation_context("outer", component="outer"):
+        with logger.correlation_context("inner", component="inner"):
+            logger.info("inner")
+        logger.info("outer")
+    logger.info("none")
+    
+    entries = read_entries(logger, log_file)
+    
+    assert [entry["correlation_id"] for entry in entries] == ["inner", "outer", "no-correlation"]
+    assert entries[2]["component"] == "unknown"
+
+
+def test_queued_records_keep_extra_fields_and_exceptions(tmp_path):
+    log_file = tmp_path / "sdd.log"
+    logger = SDDLogger("sdd.test.fields", log_file=log_file)
+    
+    logger.info("Completed step", duration_ms=12, extra_data={"step": "verify"})
+    try:
+        raise ValueError("bad spec")
+    except ValueError:
+        logger.logger.exception("Failed step %s", "verify")
+    
+    done, failed = read_entries(logger, log_file)
+    
+    assert done["duration_ms"] == 12
+    assert done["data"] == {"step": "verify"}
+    assert done["timestamp"].endswith("Z")
+    assert failed["message"] == "Failed step verify"
+    assert "ValueError: bad spec" in failed["exception"]
+
+
+def test_disabled_levels_are_not_written(tmp_path):
+    log_file = tmp_path / "sdd.log"
+    logger = SDDLogger("sdd.test.levels", log_level="INFO", log_file=log_file)
+    
+    logger.debug("hidden", extra_data={"a": 1})
+    logger.log_mcp_call("server", "tool", {"a": 1}, result={"ok": True})
+    logger.log_mcp_call("server", "tool", {"a": 1}, error="failed")
+    
+    entries = read_entries(logger, log_file)
+    
+    assert [entry["message"] for entry in entries] == ["MCP call failed: server.tool"]
+
+
+def test_closing_handlers_flushes_and_closes_the_log_file(tmp_path):
+    log_file = tmp_path / "sdd.log"
+    logger = SDDLogger("sdd.test.close", log_file=log_file)
+    listener = logger.logger.handlers[0].listener
+    file_handler = next(handler.target for handler in listener.handlers
+                        if isinstance(handler, logging.handlers.MemoryHandler))
+    
+    logger.info("buffered")
+    _close_handlers(logger.logger)
+    
+    # Checked while file_handler is still referenced, so nothing relies on
+    # garbage collection to flush the buffered stream
+    assert file_handler.stream is None
+    assert json.loads(log_file.read_text())["message"] == "buffered"